@@ -62,8 +62,17 @@ class MovieAdmin(admin.ModelAdmin):
         'original_language',
         'collection',
     ]
+    readonly_fields = ('genre_ids',)
     ordering = ['-tmdb_popularity']
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+
+        # Keep genre IDs used by movie list filters in sync with edited genres
+        movie = form.instance
+        movie.genre_ids = sorted(movie.genres.values_list('pk', flat=True))
+        movie.save(update_fields=['genre_ids'])
+
 
 @admin.register(models.MovieEngagement)
 class MovieEngagementAdmin(admin.ModelAdmin):
@@ -1,12 +1,16 @@
 import asyncio
 import logging
 import os
+import threading
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 from urllib.parse import urlencode, urljoin
 
 import aiohttp
 import requests
-from aiolimiter import AsyncLimiter
+from django.core.cache import cache
 from django.utils import timezone
 from ratelimit import limits, sleep_and_retry
 from requests.adapters import HTTPAdapter
@@ -14,6 +18,7 @@ from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_
 from urllib3.util import Retry
 
 from ..exceptions import RetryableError
+from ..utils import json_loads
 
 logger = logging.getLogger('moviedb')
 
@@ -38,16 +43,22 @@ def retry_error_callback(retry_state: RetryCallState):
         return 0
 
 
+@lru_cache(maxsize=4096)
+def _join_url(base_url: str, path: str) -> str:
+    """Cached urljoin, paginated endpoints request the same path for every page."""
+
+    return urljoin(base_url, path)
+
+
 class BaseTMDB:
     """Base class for TMDB API wrapper."""
 
     BASE_URL = 'https://api.themoviedb.org/3/'
 
     def _build_url(self, path: str, params: dict = None) -> str:
-        if params is None:
-            params = {}
+        url = _join_url(self.BASE_URL, path)
 
-        return f'{urljoin(self.BASE_URL, path)}?{urlencode(params)}'
+        return f'{url}?{urlencode(params)}' if params else url
 
 
 class TMDB(BaseTMDB):
@@ -64,6 +75,9 @@ class TMDB(BaseTMDB):
         status_forcelist=[429, 500, 502, 503, 504],
     )
 
+    # How long responses of static endpoints are cached
+    cache_timeout = 60 * 60 * 24
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update(
@@ -72,7 +86,9 @@ class TMDB(BaseTMDB):
                 'Authorization': f'Bearer {os.getenv("TMDB_ACCESS_TOKEN")}',
             }
         )
-        self.session.mount('https://', HTTPAdapter(max_retries=self.retry))
+        # One connection pool for TMDB host, sized to the rate limit so concurrent requests don't open extra connections
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.calls, max_retries=self.retry)
+        self.session.mount('https://', adapter)
 
     @sleep_and_retry
     @limits(calls=calls, period=rate_limit)
@@ -93,6 +109,19 @@ class TMDB(BaseTMDB):
 
             return {}
 
+    def _fetch_cached(self, path: str, params: dict = None) -> dict | list:
+        """Fetch data that rarely changes (genres, configuration), successful responses are cached for a day."""
+
+        cache_key = f'tmdb:{self._build_url(path, params)}'
+        data = cache.get(cache_key)
+
+        if data is None:
+            data = self._fetch_data(path, params)
+            if data:
+                cache.set(cache_key, data, self.cache_timeout)
+
+        return data
+
     def fetch_genres(self, language: str = 'en') -> list[dict]:
         """Fetch the list of official genres for movies.
 
@@ -105,7 +134,7 @@ class TMDB(BaseTMDB):
 
         path = 'genre/movie/list'
         params = {'language': language}
-        data = self._fetch_data(path, params)
+        data = self._fetch_cached(path, params)
 
         return data.get('genres', [])
 
@@ -113,9 +142,9 @@ class TMDB(BaseTMDB):
         """Fetch TMDB configuration - static lists of data they use throughout the database."""
 
         path = f'configuration/{data_type}'
-        params = {'language': language} if language is not None else {}
+        params = {'language': language} if language is not None else None
 
-        return self._fetch_data(path, params)
+        return self._fetch_cached(path, params)
 
     def fetch_countries(self, language: str = 'en-US') -> list[dict]:
         """Get the list of countries (ISO 3166-1 tags) used throughout TMDB.
@@ -143,6 +172,9 @@ class TMDB(BaseTMDB):
         return self._fetch_configuration(data_type)
 
     def _fetch_by_id(self, path: str, language: str = None, append_to_response: list[str] = None) -> dict:
+        if language is None and append_to_response is None:
+            return self._fetch_data(path)
+
         params = {}
         if language is not None:
             params['language'] = language
@@ -195,7 +227,8 @@ class TMDB(BaseTMDB):
 
         path = f'company/{company_id}'
 
-        return self._fetch_by_id(path=path)
+        # Endpoint takes no params
+        return self._fetch_data(path)
 
     def fetch_collection_by_id(self, collection_id: int, language: str = 'en-US') -> dict:
         """Fetch collection details by ID.
@@ -212,22 +245,38 @@ class TMDB(BaseTMDB):
 
         return self._fetch_by_id(path=path, language=language)
 
-    def _fetch_pages(self, path: str, first_page: int, last_page: int, language: str, region: str = None) -> list[dict]:
-        """Fetch pages of data from endpoints that support pagination."""
+    def _fetch_pages(
+        self,
+        path: str,
+        first_page: int,
+        last_page: int,
+        language: str,
+        region: str = None,
+        concurrent: bool = True,
+    ) -> list[dict]:
+        """Fetch pages of data from endpoints that support pagination.
+
+        If `concurrent` is True, pages are fetched in a thread pool, rate limit is still shared between threads.
+        Order of pages is preserved either way.
+        """
 
         if last_page is None:
             last_page = first_page
 
-        pages = []
+        pages_params = []
 
         for page in range(first_page, last_page + 1):
             params = {'page': page, 'language': language}
             if region is not None:
                 params['region'] = region
 
-            pages.append(self._fetch_data(path, params))
+            pages_params.append(params)
 
-        return pages
+        if not concurrent or len(pages_params) == 1:
+            return [self._fetch_data(path, params) for params in pages_params]
+
+        with ThreadPoolExecutor(max_workers=min(self.calls, len(pages_params))) as executor:
+            return list(executor.map(lambda params: self._fetch_data(path, params), pages_params))
 
     def fetch_popular_movies(self, first_page: int = 1, last_page: int = None, language: str = 'en-US', region: str = None) -> list[dict]:
         """Fetch most popular movies.
@@ -314,85 +363,179 @@ class asyncTMDB(BaseTMDB):
             'accept': 'application/json',
             'Authorization': f'Bearer {os.getenv("TMDB_ACCESS_TOKEN")}',
         }
-        self.limiter = AsyncLimiter(self.calls, self.rate_limit)
+        # Token bucket for rate limiting
+        self._rate = self.calls / self.rate_limit
+        self._tokens = self.calls
+        self._last_refill = None
         self.session = None
+        self._session_loop = None
+        # Requests that are currently running, keyed by URL
+        self._inflight = {}
+        self._loop = None
+        self._loop_thread = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get event loop running in a background thread, it's started on first use."""
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, name='asyncTMDB', daemon=True)
+            self._loop_thread.start()
+        return self._loop
 
     def run_sync(self, coro):
-        """Run async code in a synchronous context."""
+        """Run async code in a synchronous context.
+
+        All calls are run in the same background event loop, so HTTP session and its connections
+        are kept between calls instead of being recreated with a new loop each time.
+        """
 
         try:
-            loop = asyncio.get_event_loop()
+            asyncio.get_running_loop()
         except RuntimeError:
-            return asyncio.run(coro)
+            return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
 
-        if loop.is_running():
-            raise RuntimeError("Can't call sync method from within async event loop")
+        coro.close()
+        raise RuntimeError("Can't call sync method from within async event loop")
 
-        return loop.run_until_complete(coro)
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get HTTP session, it stays open between calls so keep-alive connections are reused across batches.
 
-    async def _get_session(self):
-        if self.session is None or self.session.closed:
-            connector = aiohttp.TCPConnector(limit=self.calls)
+        Session is bound to the event loop it was created in, so a new one is created if the loop has changed.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self.session is None or self.session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.calls, limit_per_host=self.calls, ttl_dns_cache=300, keepalive_timeout=75)
             timeout = aiohttp.ClientTimeout(total=20)
             self.session = aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+            self._session_loop = loop
         return self.session
 
+    async def aclose(self):
+        """Close HTTP session if it's open."""
+
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._session_loop = None
+
+    def close(self):
+        """Close HTTP session and stop background event loop."""
+
+        if self._loop is None:
+            return
+
+        self.run_sync(self.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+
+    async def _acquire(self):
+        """Wait until request can be made without exceeding rate limit.
+
+        Token bucket refilled based on loop time. All requests run on one event loop and there's no await between
+        reading and updating tokens, so no lock is needed. Tokens can go negative, that's the time later requests
+        have to wait for the slot they reserved.
+        """
+
+        now = asyncio.get_running_loop().time()
+        if self._last_refill is None:
+            self._last_refill = now
+
+        self._tokens = min(self.calls, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+        self._tokens -= 1
+
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+    async def _fetch_data(self, path: str, params: dict = None, is_by_id: bool = False, url: str = None) -> dict | int:
+        """Main method to make asynchronous requests to TMDB API.
+
+        `url` can be passed if it's already built, then `params` are ignored. Concurrent calls for the same URL
+        share one request instead of each making its own.
+        """
+
+        if url is None:
+            url = self._build_url(path, params)
+
+        key = (url, is_by_id)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(path, url, is_by_id=is_by_id))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so that cancelling one caller doesn't cancel request for the others
+        return await asyncio.shield(task)
+
     @retry(
         retry=retry_if_exception_type(RetryableError),
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry_error_callback=retry_error_callback,
     )
-    async def _fetch_data(self, path: str, params: dict = None, is_by_id: bool = False) -> dict | int:
-        """Main method to make asynchronous requests to TMDB API."""
-
-        url = self._build_url(path, params)
+    async def _request(self, path: str, url: str, is_by_id: bool = False) -> dict | int:
+        """Make request and handle errors, retried on rate limit, server errors and timeouts."""
 
-        async with self.limiter:
-            try:
-                async with self.session.get(url, timeout=10) as response:
-                    response.raise_for_status()
-                    return await response.json()
+        session = await self._get_session()
+        await self._acquire()
+        try:
+            async with session.get(url, timeout=10) as response:
+                response.raise_for_status()
+                return await response.json(loads=json_loads)
 
-            except aiohttp.ClientResponseError as e:
-                if e.status in (401, 403):
-                    logger.error('Unauthorized or Forbidden: %s, status: %s.', e.__class__.__name__, e.status)
-                    raise
-                if e.status in (429, 500, 502, 503, 504):
-                    raise RetryableError(e.__class__.__name__, status=e.status)
+        except aiohttp.ClientResponseError as e:
+            if e.status in (401, 403):
+                logger.error('Unauthorized or Forbidden: %s, status: %s.', e.__class__.__name__, e.status)
+                raise
+            if e.status in (429, 500, 502, 503, 504):
+                raise RetryableError(e.__class__.__name__, status=e.status)
 
-                if e.status != 404:
-                    logger.warning('Failed to fetch data: %s, status: %s.', e.__class__.__name__, e.status)
+            if e.status != 404:
+                logger.warning('Failed to fetch data: %s, status: %s.', e.__class__.__name__, e.status)
 
-                if is_by_id:
-                    if e.status == 404:
-                        return int(path.split('/')[-1])
-                    return 0
+            if is_by_id:
+                if e.status == 404:
+                    return int(path.split('/')[-1])
+                return 0
 
-            except asyncio.TimeoutError as e:
-                raise RetryableError(e.__class__.__name__)
+        except asyncio.TimeoutError as e:
+            raise RetryableError(e.__class__.__name__)
 
-            except aiohttp.ClientError as e:
-                logger.warning('Failed to fetch data: %s.', e.__class__.__name__)
+        except aiohttp.ClientError as e:
+            logger.warning('Failed to fetch data: %s.', e.__class__.__name__)
 
-                if is_by_id:
-                    return 0
+            if is_by_id:
+                return 0
 
     async def _batch_fetch(
         self,
         task_details: list[str, dict] | list[str],
         const_params: dict = None,
         is_by_id: bool = False,
+        query: str = None,
     ) -> tuple[list[dict], list[int]]:
-        """Fetch one batch of data."""
+        """Fetch one batch of data.
+
+        If params are the same for every path, they can be passed as `const_params` or as already encoded `query`,
+        then `task_details` is a list of paths.
+        """
 
         results = []
         batch_not_fetched = []
 
-        if const_params is None:
+        if const_params is not None:
+            query = f'?{urlencode(const_params)}' if const_params else ''
+
+        if query is None:
             tasks = [self._fetch_data(path, params, is_by_id=is_by_id) for path, params in task_details]
         else:
-            tasks = [self._fetch_data(path, const_params, is_by_id=is_by_id) for path in task_details]
+            base_url = self.BASE_URL
+            tasks = [self._fetch_data(path, is_by_id=is_by_id, url=f'{urljoin(base_url, path)}{query}') for path in task_details]
 
         responses = await asyncio.gather(*tasks)
 
@@ -417,15 +560,17 @@ class asyncTMDB(BaseTMDB):
         if append_to_response is not None:
             params['append_to_response'] = ','.join(append_to_response)
 
+        # Same params are used for every batch, encode them once
+        query = f'?{urlencode(params)}' if params else ''
+
         all_results = []
         not_fetched = []
 
-        async with await self._get_session():
-            for i in range(0, len(paths), batch_size):
-                batch = paths[i : i + batch_size]
-                results, batch_not_fetched = await self._batch_fetch(task_details=batch, const_params=params, is_by_id=True)
-                all_results.extend(results)
-                not_fetched.extend(batch_not_fetched)
+        for i in range(0, len(paths), batch_size):
+            batch = paths[i : i + batch_size]
+            results, batch_not_fetched = await self._batch_fetch(task_details=batch, query=query, is_by_id=True)
+            all_results.extend(results)
+            not_fetched.extend(batch_not_fetched)
 
         # Make sure result contains only data with unique IDs
         unique_results = list({data['id']: data for data in all_results}.values())
@@ -527,7 +672,7 @@ class asyncTMDB(BaseTMDB):
 
         return self.run_sync(self._fetch_by_id(paths=paths, language=language, batch_size=batch_size))
 
-    async def _fetch_pages(
+    async def _iter_pages(
         self,
         path: str,
         first_page: int,
@@ -536,8 +681,8 @@ class asyncTMDB(BaseTMDB):
         language: str = 'en-US',
         region: str = None,
         batch_size: int = 100,
-    ) -> list[dict]:
-        """Fetch pages of data from endpoints that support pagination."""
+    ) -> AsyncIterator[dict]:
+        """Fetch pages of data from endpoints that support pagination, yield pages as each batch is fetched."""
 
         if last_page is None:
             last_page = first_page
@@ -551,15 +696,62 @@ class asyncTMDB(BaseTMDB):
             detail.update(change_dates)
             task_details.append((path, detail))
 
-        all_pages = []
+        for i in range(0, len(task_details), batch_size):
+            batch = task_details[i : i + batch_size]
+            results, _ = await self._batch_fetch(task_details=batch)
+            for page in results:
+                yield page
+
+    async def _fetch_pages(
+        self,
+        path: str,
+        first_page: int,
+        last_page: int,
+        change_dates: dict = None,
+        language: str = 'en-US',
+        region: str = None,
+        batch_size: int = 100,
+    ) -> list[dict]:
+        """Fetch pages of data from endpoints that support pagination."""
+
+        pages = self._iter_pages(path, first_page, last_page, change_dates, language, region, batch_size)
 
-        async with await self._get_session():
-            for i in range(0, len(task_details), batch_size):
-                batch = task_details[i : i + batch_size]
-                results, _ = await self._batch_fetch(task_details=batch)
-                all_pages.extend(results)
+        return [page async for page in pages]
 
-        return all_pages
+    def fetch_many_pages(self, specs: list[dict], batch_size: int = 100) -> list[list[dict]]:
+        """Fetch pages from several paginated endpoints at once, all of them share one session and rate limit.
+
+        Args:
+            specs (list[dict]): arguments for each endpoint - path, first_page, last_page and optionally
+                language and region, e.g. {'path': 'movie/popular', 'first_page': 1, 'last_page': 10}.
+            batch_size (int, optional): number of pages to fetch per batch for each endpoint. Defaults to 100.
+
+        Returns:
+            list[list[dict]]: list of pages for each spec, in the same order as specs.
+        """
+
+        async def gather_pages():
+            return list(await asyncio.gather(*(self._fetch_pages(**spec, batch_size=batch_size) for spec in specs)))
+
+        return self.run_sync(gather_pages())
+
+    def _iter_sync(self, pages: AsyncIterator[dict]) -> Iterator[dict]:
+        """Iterate over async iterator of pages in a synchronous context, only one batch is kept in memory at a time.
+
+        Async iterator is closed when iteration stops, also when it stops early, so it doesn't keep running on the loop.
+        """
+
+        async def next_page():
+            return await anext(pages, None)
+
+        async def close_pages():
+            await pages.aclose()
+
+        try:
+            while (page := self.run_sync(next_page())) is not None:
+                yield page
+        finally:
+            self.run_sync(close_pages())
 
     def fetch_popular_movies(
         self,
@@ -652,8 +844,8 @@ class asyncTMDB(BaseTMDB):
 
         path = 'movie/top_rated'
 
-        pages = self.run_sync(
-            self._fetch_pages(
+        pages = self._iter_sync(
+            self._iter_pages(
                 path=path,
                 first_page=first_page,
                 last_page=last_page,
@@ -764,8 +956,8 @@ class asyncTMDB(BaseTMDB):
                 logger.warning("Couldn't fetch changes for %s.", cur_date_str)
                 continue
 
-            data = self.run_sync(
-                self._fetch_pages(
+            data = self._iter_sync(
+                self._iter_pages(
                     path=path,
                     first_page=1,
                     last_page=min(total_pages, 500),  # Max. page is 500
@@ -1,15 +1,56 @@
 import gzip
-import json
 import logging
+import os
+import re
+import tempfile
+import zlib
 from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
 
 import requests
 from django.utils import timezone
 from requests.exceptions import RequestException
+from urllib3.exceptions import HTTPError
+
+from ..utils import json_loads
 
 logger = logging.getLogger('moviedb')
 
 
+class _CachingStream:
+    """Pass through reads from a download stream and save the bytes to disk.
+
+    File is kept only if the stream was read to the end, partial downloads are discarded on close. Bytes are written to
+    a unique temporary file next to `path`, so concurrent downloads of the same export don't write to the same file.
+    """
+
+    def __init__(self, stream: BinaryIO, path: Path, etag: str):
+        self.stream = stream
+        self.path = path
+        self.etag = etag
+        self.part_file = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'{path.name}.', suffix='.part', delete=False)
+        self.complete = False
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        if data:
+            self.part_file.write(data)
+        elif size != 0:
+            self.complete = True
+        return data
+
+    def close(self):
+        self.stream.close()
+        self.part_file.close()
+
+        if self.complete:
+            os.replace(self.part_file.name, self.path)
+            self.path.with_name(f'{self.path.name}.etag').write_text(self.etag)
+        else:
+            Path(self.part_file.name).unlink(missing_ok=True)
+
+
 class IDExport:
     """Download and extract TMDB daily ID export files."""
 
@@ -24,6 +65,13 @@ class IDExport:
         'company': 'production_company',
     }
 
+    # Downloaded files are kept here with their ETags for conditional requests
+    CACHE_DIR = Path(tempfile.gettempdir()) / 'tmdb_id_exports'
+
+    # "id" is the first numeric key of each line, much cheaper to match than parsing the whole object
+    ID_PATTERN = re.compile(rb'"id":\s*(\d+)')
+    READ_BLOCK_SIZE = 1024 * 1024
+
     def _build_url(self, media_type: str, published_date: str) -> tuple[str, str]:
         if published_date is None:
             published_date = timezone.now().strftime('%m_%d_%Y')
@@ -32,28 +80,94 @@ class IDExport:
 
         return self.BASE_URL + path, published_date
 
-    def _fetch_id_file(self, media_type: str, published_date: str) -> bytes | None:
+    def _fetch_id_file(self, media_type: str, published_date: str) -> BinaryIO | None:
+        """Start downloading ID file, return raw gzipped stream so it can be decompressed while it's downloading.
+
+        Several commands fetch the same export on the same day, so downloaded file is saved to disk and
+        next requests are conditional, if file hasn't changed (304) local copy is returned.
+        """
+
         url, published_date = self._build_url(media_type, published_date)
 
+        filename = url.rsplit('/', 1)[-1]
+        local_path = self.CACHE_DIR / filename
+        etag_path = self.CACHE_DIR / f'{filename}.etag'
+
+        headers = {}
+        if local_path.exists() and etag_path.exists():
+            headers['If-None-Match'] = etag_path.read_text()
+
         try:
-            response = requests.get(url, timeout=20)
+            response = requests.get(url, headers=headers, timeout=20, stream=True)
             response.raise_for_status()
-            return response.content
         except RequestException:
             logger.error("Couldn't fetch ID file for media type: %s, date: %s.", media_type, published_date)
+            return
+
+        if response.status_code == 304:
+            response.close()
+            return local_path.open('rb')
+
+        # Read gzipped bytes as is, file is decompressed by GzipFile
+        response.raw.decode_content = False
+
+        etag = response.headers.get('ETag')
+        if etag is None:
+            return response.raw
+
+        # Remove exports of previous days for this media type
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for old_file in self.CACHE_DIR.glob(f'{self.MEDIA_TYPES[media_type]}_ids_*'):
+            if not old_file.name.startswith(filename):
+                old_file.unlink(missing_ok=True)
+
+        return _CachingStream(response.raw, local_path, etag)
+
+    def _remove_cached_file(self, media_type: str, published_date: str):
+        """Remove saved ID file and its ETag, so the file is downloaded again next time."""
+
+        url, _ = self._build_url(media_type, published_date)
+        filename = url.rsplit('/', 1)[-1]
 
-    def _get_ids(self, compressed_file: bytes, sort_by_popularity: bool = False, include_popularity: bool = False) -> list[int]:
+        (self.CACHE_DIR / f'{filename}.etag').unlink(missing_ok=True)
+        (self.CACHE_DIR / filename).unlink(missing_ok=True)
+
+    def _get_ids(
+        self,
+        compressed_file: bytes | BinaryIO,
+        sort_by_popularity: bool = False,
+        include_popularity: bool = False,
+    ) -> list[int]:
         """
         Unzip fetched file, deserialize lines containing JSON to python dict, store IDs and popularity in a list
         then sort it by popularity if needed, return list of IDs.
         """
 
+        if isinstance(compressed_file, bytes):
+            compressed_file = BytesIO(compressed_file)
+
+        # Only IDs are needed, extract them without deserializing JSON. Decompressed data is scanned in large blocks
+        # instead of line by line, only the incomplete last line of a block is carried over to the next one
+        if not sort_by_popularity and not include_popularity:
+            ids = []
+            tail = b''
+            with gzip.GzipFile(fileobj=compressed_file) as gz_file:
+                while block := gz_file.read(self.READ_BLOCK_SIZE):
+                    block = tail + block
+                    end = block.rfind(b'\n') + 1
+                    ids.extend(map(int, self.ID_PATTERN.findall(block, 0, end)))
+                    tail = block[end:]
+
+            ids.extend(map(int, self.ID_PATTERN.findall(tail)))
+            return ids
+
         ids = []
-        with gzip.GzipFile(fileobj=BytesIO(compressed_file)) as gz_file:
+        with gzip.GzipFile(fileobj=compressed_file) as gz_file:
             for line in gz_file:
-                line = line.decode('utf-8').strip()
+                # Both orjson and json parse bytes directly, no need to decode lines
+                line = line.strip()
                 if line:
-                    data = json.loads(line)
+                    data = json_loads(line)
 
                     # Store tuples of id and popularity
                     ids.append((data['id'], data.get('popularity', 0)))
@@ -110,6 +224,17 @@ class IDExport:
         if id_file is None:
             return
 
-        ids = self._get_ids(id_file, sort_by_popularity=sort_by_popularity, include_popularity=include_popularity)
+        try:
+            ids = self._get_ids(id_file, sort_by_popularity=sort_by_popularity, include_popularity=include_popularity)
+        except (RequestException, HTTPError, OSError, EOFError, zlib.error, ValueError):
+            # Download can still fail mid-stream
+            logger.error("Couldn't read ID file for media type: %s, date: %s.", media_type, published_date)
+            ids = None
+        finally:
+            id_file.close()
+
+        # Saved file may be the one that's corrupted, don't reuse it
+        if ids is None:
+            self._remove_cached_file(media_type, published_date)
 
         return ids
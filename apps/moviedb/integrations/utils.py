@@ -0,0 +1,8 @@
+try:
+    # Faster JSON parsers, optional
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from msgspec.json import decode as json_loads
+    except ImportError:
+        from json import loads as json_loads
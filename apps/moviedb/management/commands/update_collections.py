@@ -75,7 +75,12 @@ class Command(BaseCommand):
         existing_ids = set(Collection.objects.only('tmdb_id').values_list('tmdb_id', flat=True))
         collection_ids = [id for id in collection_ids if id not in existing_ids]
 
-        collections, missing_ids = asyncTMDB().fetch_collections_by_id(collection_ids, batch_size=batch_size, language=language)
+        tmdb = asyncTMDB()
+        try:
+            collections, missing_ids = tmdb.fetch_collections_by_id(collection_ids, batch_size=batch_size, language=language)
+        finally:
+            tmdb.close()
+
         collection_objs = []
         new_slugs = set()
 
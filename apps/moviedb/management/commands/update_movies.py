@@ -89,68 +89,71 @@ class Command(BaseCommand):
         is_update = operation == 'update_changed'
 
         tmdb = asyncTMDB()
+        try:
+            match operation:
+                case 'update_changed':
+                    movie_ids, earliest_date = tmdb.fetch_changed_ids('movie', days=days)
+
+                    # Get movie IDs that were last updated before the changes earliest date
+                    movie_ids = list(
+                        models.Movie.objects.filter(
+                            last_update__lt=earliest_date,
+                            tmdb_id__in=movie_ids,
+                            removed_from_tmdb=False,
+                        ).values_list('tmdb_id', flat=True)
+                    )
+                case 'daily_export':
+                    existing_ids = set(models.Movie.objects.only('tmdb_id').values_list('tmdb_id', flat=True))
+                    movie_ids = IDExport().fetch_ids('movie', published_date=published_date, sort_by_popularity=sort_by_popularity)
+                    if movie_ids is None:
+                        return
+                case 'add_top_rated':
+                    existing_ids = set(models.Movie.objects.only('tmdb_id').values_list('tmdb_id', flat=True))
+                    movie_ids = tmdb.fetch_top_rated_movie_ids(last_page=500)
+                case 'specific_ids':
+                    if ids is None:
+                        raise CommandError('Must provide --ids using specific_ids operation')
+                    existing_ids = set(models.Movie.objects.filter(tmdb_id__in=ids).values_list('tmdb_id', flat=True))
+                    movie_ids = ids
+                case _:
+                    raise CommandError("Invalid operation. Choose from 'update_changed', 'daily_export', 'add_top_rated', 'specific_ids'")
 
-        match operation:
-            case 'update_changed':
-                movie_ids, earliest_date = tmdb.fetch_changed_ids('movie', days=days)
-
-                # Get movie IDs that were last updated before the changes earliest date
-                movie_ids = list(
-                    models.Movie.objects.filter(
-                        last_update__lt=earliest_date,
-                        tmdb_id__in=movie_ids,
-                        removed_from_tmdb=False,
-                    ).values_list('tmdb_id', flat=True)
-                )
-            case 'daily_export':
-                existing_ids = set(models.Movie.objects.only('tmdb_id').values_list('tmdb_id', flat=True))
-                movie_ids = IDExport().fetch_ids('movie', published_date=published_date, sort_by_popularity=sort_by_popularity)
-                if movie_ids is None:
-                    return
-            case 'add_top_rated':
-                existing_ids = set(models.Movie.objects.only('tmdb_id').values_list('tmdb_id', flat=True))
-                movie_ids = tmdb.fetch_top_rated_movie_ids(last_page=500)
-            case 'specific_ids':
-                if ids is None:
-                    raise CommandError('Must provide --ids using specific_ids operation')
-                existing_ids = set(models.Movie.objects.filter(tmdb_id__in=ids).values_list('tmdb_id', flat=True))
-                movie_ids = ids
-            case _:
-                raise CommandError("Invalid operation. Choose from 'update_changed', 'daily_export', 'add_top_rated', 'specific_ids'")
-
-        if not is_update:
-            movie_ids = [id for id in movie_ids if id not in existing_ids]
-
-        if limit is not None:
-            movie_ids = movie_ids[:limit]
+            if not is_update:
+                movie_ids = [id for id in movie_ids if id not in existing_ids]
 
-        logger.info('Starting to fetch %s movies...', len(movie_ids))
+            if limit is not None:
+                movie_ids = movie_ids[:limit]
 
-        movies, not_fetched_movie_ids = tmdb.fetch_movies_by_id(
-            movie_ids,
-            batch_size=batch_size,
-            language=language,
-            append_to_response=['credits'],
-        )
+            logger.info('Starting to fetch %s movies...', len(movie_ids))
 
-        # Existing countreis/languages/genres in db
-        self.countries = {c.code for c in models.Country.objects.all()}
-        languages = {l.code for l in models.Language.objects.all()}
-        genres = {g.tmdb_id for g in models.Genre.objects.all()}
+            movies, not_fetched_movie_ids = tmdb.fetch_movies_by_id(
+                movie_ids,
+                batch_size=batch_size,
+                language=language,
+                append_to_response=['credits'],
+            )
 
-        # Create missing people, companies and collections
-        credits = []
-        companies = []
-        collections = []
-        for movie_data in movies:
-            credits_data = movie_data.get('credits', {})
-            credits.extend(credits_data.get('cast', []) + credits_data.get('crew', []))
-            companies.extend(movie_data.get('production_companies', []))
-            collection = movie_data.get('belongs_to_collection', {})
-            if collection:
-                collections.append(collection)
+            # Existing countreis/languages/genres in db
+            self.countries = {c.code for c in models.Country.objects.all()}
+            languages = {l.code for l in models.Language.objects.all()}
+            genres = {g.tmdb_id for g in models.Genre.objects.all()}
+
+            # Create missing people, companies and collections
+            credits = []
+            companies = []
+            collections = []
+            for movie_data in movies:
+                credits_data = movie_data.get('credits', {})
+                credits.extend(credits_data.get('cast', []) + credits_data.get('crew', []))
+                companies.extend(movie_data.get('production_companies', []))
+                collection = movie_data.get('belongs_to_collection', {})
+                if collection:
+                    collections.append(collection)
+
+            n_created_people, not_fetched_person_ids = self.create_missing_people(tmdb, credits, batch_size=batch_size)
+        finally:
+            tmdb.close()
 
-        n_created_people, not_fetched_person_ids = self.create_missing_people(tmdb, credits, batch_size=batch_size)
         n_created_companies, n_created_countries = self.create_missing_companies(companies)
         n_created_collections = self.create_missing_collections(collections)
 
@@ -186,6 +189,7 @@ class Command(BaseCommand):
             'budget',
             'revenue',
             'runtime',
+            'genre_ids',
             'documentary',
             'tv_movie',
             'short',
@@ -99,41 +99,43 @@ class Command(BaseCommand):
         is_update = operation == 'update_changed'
 
         tmdb = asyncTMDB()
+        try:
+            match operation:
+                case 'update_changed':
+                    person_ids, earliest_date = tmdb.fetch_changed_ids('person', days=days)
+
+                    # Get person IDs that were last updated before the changes earliest date
+                    person_ids = list(
+                        Person.objects.filter(
+                            last_update__lt=earliest_date,
+                            tmdb_id__in=person_ids,
+                            removed_from_tmdb=False,
+                        ).values_list('tmdb_id', flat=True)
+                    )
+                case 'daily_export':
+                    existing_ids = set(Person.objects.only('tmdb_id').values_list('tmdb_id', flat=True))
+                    person_ids = IDExport().fetch_ids('person', published_date=published_date, sort_by_popularity=sort_by_popularity)
+                    if person_ids is None:
+                        return
+                case 'specific_ids':
+                    if ids is None:
+                        raise CommandError('Must provide --ids using specific_ids operation')
+                    existing_ids = set(Person.objects.filter(tmdb_id__in=ids).values_list('tmdb_id', flat=True))
+                    person_ids = ids
+                case _:
+                    raise CommandError("Invalid operation. Choose from 'update_changed', 'daily_export', 'specific_ids'")
 
-        match operation:
-            case 'update_changed':
-                person_ids, earliest_date = tmdb.fetch_changed_ids('person', days=days)
-
-                # Get person IDs that were last updated before the changes earliest date
-                person_ids = list(
-                    Person.objects.filter(
-                        last_update__lt=earliest_date,
-                        tmdb_id__in=person_ids,
-                        removed_from_tmdb=False,
-                    ).values_list('tmdb_id', flat=True)
-                )
-            case 'daily_export':
-                existing_ids = set(Person.objects.only('tmdb_id').values_list('tmdb_id', flat=True))
-                person_ids = IDExport().fetch_ids('person', published_date=published_date, sort_by_popularity=sort_by_popularity)
-                if person_ids is None:
-                    return
-            case 'specific_ids':
-                if ids is None:
-                    raise CommandError('Must provide --ids using specific_ids operation')
-                existing_ids = set(Person.objects.filter(tmdb_id__in=ids).values_list('tmdb_id', flat=True))
-                person_ids = ids
-            case _:
-                raise CommandError("Invalid operation. Choose from 'update_changed', 'daily_export', 'specific_ids'")
-
-        if not is_update:
-            person_ids = [id for id in person_ids if id not in existing_ids]
+            if not is_update:
+                person_ids = [id for id in person_ids if id not in existing_ids]
 
-        if limit is not None:
-            person_ids = person_ids[:limit]
+            if limit is not None:
+                person_ids = person_ids[:limit]
 
-        logger.info('Starting to fetch %s people...', len(person_ids))
+            logger.info('Starting to fetch %s people...', len(person_ids))
 
-        people, missing_ids = tmdb.fetch_people_by_id(person_ids, batch_size=batch_size, language=language)
+            people, missing_ids = tmdb.fetch_people_by_id(person_ids, batch_size=batch_size, language=language)
+        finally:
+            tmdb.close()
 
         person_objs = []
         new_slugs = set()
@@ -28,34 +28,36 @@ class Command(BaseCommand):
         if export_ids is None:
             return
         tmdb = asyncTMDB()
-
-        match data_type:
-            case 'movie':
-                Model = Movie
-                missing_export_ids = list(
-                    Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
-                )
-                _, not_fetched_ids = tmdb.fetch_movies_by_id(missing_export_ids, batch_size=1000)
-            case 'person':
-                Model = Person
-                missing_export_ids = list(
-                    Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
-                )
-                _, not_fetched_ids = tmdb.fetch_people_by_id(missing_export_ids, batch_size=1000)
-            case 'collection':
-                Model = Collection
-                missing_export_ids = list(
-                    Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
-                )
-                _, not_fetched_ids = tmdb.fetch_collections_by_id(missing_export_ids, batch_size=1000)
-            case 'company':
-                Model = ProductionCompany
-                missing_export_ids = list(
-                    Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
-                )
-                _, not_fetched_ids = tmdb.fetch_companies_by_id(missing_export_ids, batch_size=1000)
-            case _:
-                raise CommandError("Invalid data type. Choose from 'movie', 'person', 'collection', 'company'")
+        try:
+            match data_type:
+                case 'movie':
+                    Model = Movie
+                    missing_export_ids = list(
+                        Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
+                    )
+                    _, not_fetched_ids = tmdb.fetch_movies_by_id(missing_export_ids, batch_size=1000)
+                case 'person':
+                    Model = Person
+                    missing_export_ids = list(
+                        Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
+                    )
+                    _, not_fetched_ids = tmdb.fetch_people_by_id(missing_export_ids, batch_size=1000)
+                case 'collection':
+                    Model = Collection
+                    missing_export_ids = list(
+                        Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
+                    )
+                    _, not_fetched_ids = tmdb.fetch_collections_by_id(missing_export_ids, batch_size=1000)
+                case 'company':
+                    Model = ProductionCompany
+                    missing_export_ids = list(
+                        Model.objects.filter(removed_from_tmdb=False).exclude(tmdb_id__in=export_ids).values_list('tmdb_id', flat=True)
+                    )
+                    _, not_fetched_ids = tmdb.fetch_companies_by_id(missing_export_ids, batch_size=1000)
+                case _:
+                    raise CommandError("Invalid data type. Choose from 'movie', 'person', 'collection', 'company'")
+        finally:
+            tmdb.close()
 
         removed_ids = [id for id in not_fetched_ids if id]
         objs_to_remove = Model.objects.filter(tmdb_id__in=removed_ids)
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moviedb', '0092_alter_movie_original_title_alter_movie_tagline_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(
+                condition=models.Q(('budget', 0), _negated=True),
+                fields=['removed_from_tmdb', 'adult', '-budget'],
+                name='movie_budget_nonzero_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(
+                condition=models.Q(('revenue', 0), _negated=True),
+                fields=['removed_from_tmdb', 'adult', '-revenue'],
+                name='movie_revenue_nonzero_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(
+                condition=models.Q(('runtime', 0), _negated=True),
+                fields=['removed_from_tmdb', 'adult', '-runtime'],
+                name='movie_runtime_nonzero_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moviedb', '0093_movie_nonzero_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(
+                fields=['original_language', 'removed_from_tmdb', 'adult', '-tmdb_popularity'],
+                name='movie_language_popularity_idx',
+            ),
+        ),
+    ]
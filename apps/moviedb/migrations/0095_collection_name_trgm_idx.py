@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moviedb', '0094_movie_language_popularity_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collection',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='collection_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
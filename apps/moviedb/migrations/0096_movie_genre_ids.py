@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:00
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moviedb', '0095_collection_name_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='genre_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.PositiveIntegerField(), blank=True, default=list, size=None),
+        ),
+        # Fill genre IDs of existing movies from movie-genre links
+        migrations.RunSQL(
+            sql="""
+                UPDATE moviedb_movie
+                SET genre_ids = links.genre_ids
+                FROM (
+                    SELECT movie_id, array_agg(genre_id ORDER BY genre_id) AS genre_ids
+                    FROM moviedb_movie_genres
+                    GROUP BY movie_id
+                ) AS links
+                WHERE moviedb_movie.tmdb_id = links.movie_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['genre_ids'], name='movie_genre_ids_gin_idx'),
+        ),
+    ]
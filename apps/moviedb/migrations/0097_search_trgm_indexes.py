@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moviedb', '0096_movie_genre_ids'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='movie_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['original_title'], name='movie_original_title_trgm_idx', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='person_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='productioncompany',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='company_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
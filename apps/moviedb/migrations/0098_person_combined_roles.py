@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moviedb', '0097_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='person',
+            name='combined_roles',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.F('cast_roles_count') + models.F('crew_roles_count'),
+                output_field=models.PositiveIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['removed_from_tmdb', 'adult', '-combined_roles'], name='person_combined_roles_idx'),
+        ),
+    ]
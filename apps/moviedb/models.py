@@ -1,3 +1,5 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
@@ -107,6 +109,8 @@ class ProductionCompany(SlugMixin):
             models.Index(fields=['-movie_count']),
             models.Index(fields=['removed_from_tmdb', '-movie_count']),
             models.Index(fields=['removed_from_tmdb', 'adult', '-movie_count']),
+            # Trigram search by name
+            GinIndex(fields=['name'], name='company_name_trgm_idx', opclasses=['gin_trgm_ops']),
         ]
 
     def __str__(self):
@@ -143,6 +147,8 @@ class Collection(SlugMixin):
         indexes = [
             models.Index(fields=['-avg_popularity']),
             models.Index(fields=['removed_from_tmdb', 'adult', 'movies_released', '-avg_popularity']),
+            # Trigram search by name
+            GinIndex(fields=['name'], name='collection_name_trgm_idx', opclasses=['gin_trgm_ops']),
         ]
 
     def __str__(self):
@@ -184,6 +190,12 @@ class Person(SlugMixin):
 
     cast_roles_count = models.PositiveIntegerField(blank=True, default=0)
     crew_roles_count = models.PositiveIntegerField(blank=True, default=0)
+    # Stored by database for sorting by combined roles with an index
+    combined_roles = models.GeneratedField(
+        expression=models.F('cast_roles_count') + models.F('crew_roles_count'),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
 
     # Actors in adult movies
     adult = models.BooleanField(blank=True, default=False)
@@ -202,7 +214,10 @@ class Person(SlugMixin):
             models.Index(fields=['removed_from_tmdb', 'adult', '-tmdb_popularity']),
             models.Index(fields=['removed_from_tmdb', 'adult', '-cast_roles_count']),
             models.Index(fields=['removed_from_tmdb', 'adult', '-crew_roles_count']),
+            models.Index(fields=['removed_from_tmdb', 'adult', '-combined_roles'], name='person_combined_roles_idx'),
             models.Index(fields=['removed_from_tmdb', 'adult', 'known_for_department', '-tmdb_popularity']),
+            # Trigram search by name
+            GinIndex(fields=['name'], name='person_name_trgm_idx', opclasses=['gin_trgm_ops']),
         ]
 
     def __str__(self):
@@ -229,6 +244,8 @@ class Movie(SlugMixin):
     release_date = models.DateField(null=True, blank=True)
 
     genres = models.ManyToManyField(Genre, blank=True, related_name='movies')
+    # Copy of genre IDs to filter movies by several genres with one indexed lookup
+    genre_ids = ArrayField(models.PositiveIntegerField(), blank=True, default=list)
 
     # Is this a documentary
     documentary = models.BooleanField(blank=True, default=False)
@@ -300,6 +317,19 @@ class Movie(SlugMixin):
             models.Index(fields=['removed_from_tmdb', 'adult', '-tmdb_popularity']),
             models.Index(fields=['removed_from_tmdb', 'adult', '-release_date']),
             models.Index(fields=['removed_from_tmdb', 'adult', '-tmdb_popularity', '-release_date']),
+            # Sorting by budget, revenue or runtime excludes movies without a value, index only the rest
+            models.Index(fields=['removed_from_tmdb', 'adult', '-budget'], condition=~models.Q(budget=0), name='movie_budget_nonzero_idx'),
+            models.Index(fields=['removed_from_tmdb', 'adult', '-revenue'], condition=~models.Q(revenue=0), name='movie_revenue_nonzero_idx'),
+            models.Index(fields=['removed_from_tmdb', 'adult', '-runtime'], condition=~models.Q(runtime=0), name='movie_runtime_nonzero_idx'),
+            # Movies by language list, default sort
+            models.Index(
+                fields=['original_language', 'removed_from_tmdb', 'adult', '-tmdb_popularity'],
+                name='movie_language_popularity_idx',
+            ),
+            GinIndex(fields=['genre_ids'], name='movie_genre_ids_gin_idx'),
+            # Trigram search by title and original title
+            GinIndex(fields=['title'], name='movie_title_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['original_title'], name='movie_original_title_trgm_idx', opclasses=['gin_trgm_ops']),
         ]
 
     def __str__(self):
@@ -309,8 +339,9 @@ class Movie(SlugMixin):
         return reverse('movie_detail', kwargs={'slug': self.slug})
 
     def categorize(self, genre_ids: list[int]):
-        """Set documentary, tv_movie and short fields based on genres and runtime."""
+        """Set genre_ids, documentary, tv_movie and short fields based on genres and runtime."""
 
+        self.genre_ids = sorted(set(genre_ids))
         self.documentary = GenreIDs.DOCUMENTARY in genre_ids
         self.tv_movie = GenreIDs.TV_MOVIE in genre_ids
         self.short = bool(self.runtime and self.runtime <= 40)
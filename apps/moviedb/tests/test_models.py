@@ -311,7 +311,8 @@ class MovieModelTests(BaseTestCase):
         self.assertEqual(self.movie.get_absolute_url(), expected_url)
 
     def test_movie_categorize(self):
-        self.movie.categorize(genre_ids=[99, 10770])
+        self.movie.categorize(genre_ids=[10770, 99])
+        self.assertEqual(self.movie.genre_ids, [99, 10770])
         self.assertTrue(self.movie.documentary)
         self.assertTrue(self.movie.tv_movie)
         self.assertFalse(self.movie.short)
@@ -1,11 +1,15 @@
+import asyncio
 import gzip
 import json
 import logging
 from datetime import date
 from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import AsyncMock, Mock, patch
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from requests.exceptions import HTTPError, RequestException
 
@@ -52,13 +56,44 @@ class IDExportTests(TestCase):
     def test_fetch_id_file_success(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = self.compressed_data
+        mock_response.raw = BytesIO(self.compressed_data)
+        mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
-        result = self.id_export._fetch_id_file(self.media_type, self.published_date)
-        self.assertEqual(result, self.compressed_data)
-        mock_get.assert_called_once_with('http://files.tmdb.org/p/exports/movie_ids_09_03_2025.json.gz', timeout=20)
+        with TemporaryDirectory() as cache_dir, patch.object(IDExport, 'CACHE_DIR', Path(cache_dir)):
+            result = self.id_export._fetch_id_file(self.media_type, self.published_date)
+        self.assertIs(result, mock_response.raw)
+        self.assertFalse(result.decode_content)
+        mock_get.assert_called_once_with(
+            'http://files.tmdb.org/p/exports/movie_ids_09_03_2025.json.gz', headers={}, timeout=20, stream=True
+        )
+
+    @patch('requests.get')
+    def test_fetch_id_file_not_modified(self, mock_get):
+        with TemporaryDirectory() as cache_dir, patch.object(IDExport, 'CACHE_DIR', Path(cache_dir)):
+            mock_get.return_value = Mock(status_code=200, raw=BytesIO(self.compressed_data), headers={'ETag': '"v1"'})
+            self.assertEqual(self.id_export.fetch_ids(self.media_type, self.published_date), [1, 2, 3])
+
+            mock_get.return_value = Mock(status_code=304)
+            self.assertEqual(self.id_export.fetch_ids(self.media_type, self.published_date), [1, 2, 3])
+            self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+            self.assertEqual(
+                sorted(path.name for path in Path(cache_dir).iterdir()),
+                ['movie_ids_09_03_2025.json.gz', 'movie_ids_09_03_2025.json.gz.etag'],
+            )
+
+    @patch('requests.get')
+    def test_fetch_id_file_corrupted(self, mock_get):
+        with TemporaryDirectory() as cache_dir, patch.object(IDExport, 'CACHE_DIR', Path(cache_dir)):
+            mock_get.return_value = Mock(status_code=200, raw=BytesIO(self.compressed_data), headers={'ETag': '"v1"'})
+            self.id_export.fetch_ids(self.media_type, self.published_date)
+            (Path(cache_dir) / 'movie_ids_09_03_2025.json.gz').write_bytes(b'corrupted')
+
+            mock_get.return_value = Mock(status_code=304)
+            with patch('logging.Logger.error'):
+                self.assertIsNone(self.id_export.fetch_ids(self.media_type, self.published_date))
+            self.assertEqual(list(Path(cache_dir).iterdir()), [])
 
     @patch('requests.get')
     def test_fetch_id_file_request_exception(self, mock_get):
@@ -74,6 +109,15 @@ class IDExportTests(TestCase):
         ids = self.id_export._get_ids(self.compressed_data)
         self.assertEqual(ids, [1, 2, 3])
 
+    def test_get_ids_quoted_id_in_name(self):
+        data = [{'id': 1, 'name': 'The "id": 2'}, {'id': 3, 'name': 'Paramount'}]
+        ids = self.id_export._get_ids(self._create_compressed_data(data))
+        self.assertEqual(ids, [1, 3])
+
+    def test_get_ids_from_stream(self):
+        ids = self.id_export._get_ids(BytesIO(self.compressed_data))
+        self.assertEqual(ids, [1, 2, 3])
+
     def test_get_ids_sort_by_popularity(self):
         ids = self.id_export._get_ids(self.compressed_data, sort_by_popularity=True)
         self.assertEqual(ids, [3, 1, 2])
@@ -99,20 +143,20 @@ class IDExportTests(TestCase):
 
     @patch('apps.moviedb.integrations.tmdb.id_exports.IDExport._fetch_id_file')
     def test_fetch_ids_valid_media_type(self, mock_fetch):
-        mock_fetch.return_value = self.compressed_data
+        mock_fetch.return_value = BytesIO(self.compressed_data)
         ids = self.id_export.fetch_ids('movie', self.published_date)
         self.assertEqual(ids, [1, 2, 3])
         mock_fetch.assert_called_once_with('movie', self.published_date)
 
     @patch('apps.moviedb.integrations.tmdb.id_exports.IDExport._fetch_id_file')
     def test_fetch_ids_sort_by_popularity(self, mock_fetch):
-        mock_fetch.return_value = self.compressed_data
+        mock_fetch.return_value = BytesIO(self.compressed_data)
         ids = self.id_export.fetch_ids('movie', self.published_date, sort_by_popularity=True)
         self.assertEqual(ids, [3, 1, 2])
 
     @patch('apps.moviedb.integrations.tmdb.id_exports.IDExport._fetch_id_file')
     def test_fetch_ids_include_popularity(self, mock_fetch):
-        mock_fetch.return_value = self.compressed_data
+        mock_fetch.return_value = BytesIO(self.compressed_data)
         ids = self.id_export.fetch_ids('movie', self.published_date, include_popularity=True)
         self.assertEqual(ids, [(1, 85.0), (2, 75.0), (3, 90.0)])
 
@@ -121,6 +165,15 @@ class IDExportTests(TestCase):
             self.id_export.fetch_ids('invalid')
         self.assertTrue('Invalid media type' in str(cm.exception))
 
+    @patch('apps.moviedb.integrations.tmdb.id_exports.IDExport._fetch_id_file')
+    def test_fetch_ids_truncated_file(self, mock_fetch):
+        mock_fetch.return_value = BytesIO(self.compressed_data[:-10])
+        with patch('logging.Logger.error') as mock_logger:
+            result = self.id_export.fetch_ids('movie', self.published_date)
+            self.assertIsNone(result)
+            mock_logger.assert_called_once_with("Couldn't read ID file for media type: %s, date: %s.", 'movie', self.published_date)
+        self.assertTrue(mock_fetch.return_value.closed)
+
     @patch('apps.moviedb.integrations.tmdb.id_exports.IDExport._fetch_id_file')
     def test_fetch_ids_fetch_failure(self, mock_fetch):
         mock_fetch.return_value = None
@@ -128,10 +181,12 @@ class IDExportTests(TestCase):
         self.assertIsNone(result)
 
 
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
 class TMDBTests(TestCase):
     """Tests for the TMDB class."""
 
     def setUp(self):
+        cache.clear()
         self.tmdb = TMDB()
         self.sample_genres = [{'id': 28, 'name': 'Action'}]
         self.sample_countries = [{'iso_3166_1': 'US', 'name': 'United States'}]
@@ -152,7 +207,7 @@ class TMDBTests(TestCase):
 
     def test_build_url_no_params(self):
         url = self.tmdb._build_url('movie/1')
-        self.assertEqual(url, 'https://api.themoviedb.org/3/movie/1?')
+        self.assertEqual(url, 'https://api.themoviedb.org/3/movie/1')
 
     @patch('requests.Session.get')
     def test_fetch_data_success(self, mock_get):
@@ -197,6 +252,25 @@ class TMDBTests(TestCase):
         self.assertEqual(result, self.sample_genres)
         mock_get.assert_called_once_with('https://api.themoviedb.org/3/genre/movie/list?language=en', timeout=10)
 
+    @patch('requests.Session.get')
+    def test_fetch_genres_cached(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.return_value = {'genres': self.sample_genres}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        self.tmdb.fetch_genres(language='en')
+        result = TMDB().fetch_genres(language='en')
+        self.assertEqual(result, self.sample_genres)
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_fetch_genres_failure_not_cached(self, mock_get):
+        mock_get.side_effect = [RequestException('Network error'), Mock(**{'json.return_value': {'genres': self.sample_genres}})]
+
+        self.assertEqual(self.tmdb.fetch_genres(language='en'), [])
+        self.assertEqual(self.tmdb.fetch_genres(language='en'), self.sample_genres)
+
     @patch('requests.Session.get')
     def test_fetch_countries(self, mock_get):
         mock_response = Mock()
@@ -217,7 +291,7 @@ class TMDBTests(TestCase):
 
         result = self.tmdb.fetch_languages()
         self.assertEqual(result, self.sample_languages)
-        mock_get.assert_called_once_with('https://api.themoviedb.org/3/configuration/languages?', timeout=10)
+        mock_get.assert_called_once_with('https://api.themoviedb.org/3/configuration/languages', timeout=10)
 
     @patch('requests.Session.get')
     def test_fetch_movie_by_id(self, mock_get):
@@ -250,7 +324,7 @@ class TMDBTests(TestCase):
 
         result = self.tmdb.fetch_company_by_id(1)
         self.assertEqual(result, self.sample_company)
-        mock_get.assert_called_once_with('https://api.themoviedb.org/3/company/1?', timeout=10)
+        mock_get.assert_called_once_with('https://api.themoviedb.org/3/company/1', timeout=10)
 
     @patch('requests.Session.get')
     def test_fetch_collection_by_id(self, mock_get):
@@ -275,6 +349,16 @@ class TMDBTests(TestCase):
         mock_get.assert_any_call('https://api.themoviedb.org/3/movie/popular?page=1&language=en-US&region=US', timeout=10)
         mock_get.assert_any_call('https://api.themoviedb.org/3/movie/popular?page=2&language=en-US&region=US', timeout=10)
 
+    @patch('requests.Session.get')
+    def test_fetch_pages_sequential(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.side_effect = [{'page': 1}, {'page': 2}]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        result = self.tmdb._fetch_pages('movie/popular', first_page=1, last_page=2, language='en-US', concurrent=False)
+        self.assertEqual(result, [{'page': 1}, {'page': 2}])
+
     @patch('requests.Session.get')
     def test_fetch_popular_movies(self, mock_get):
         mock_response = Mock()
@@ -322,6 +406,7 @@ class AsyncTMDBTests(TestCase):
 
     def setUp(self):
         self.async_tmdb = asyncTMDB()
+        self.addCleanup(self.async_tmdb.close)
         self.sample_genres = [{'id': 28, 'name': 'Action'}]
         self.sample_movie = {'id': 1, 'title': 'The Matrix', 'adult': False}
         self.sample_person = {'id': 1, 'name': 'John Doe'}
@@ -333,6 +418,50 @@ class AsyncTMDBTests(TestCase):
         url = self.async_tmdb._build_url('movie/1', {'language': 'en-US'})
         self.assertEqual(url, 'https://api.themoviedb.org/3/movie/1?language=en-US')
 
+    def test_run_sync_reuses_loop(self):
+        async def get_loop():
+            return asyncio.get_running_loop()
+
+        loop = self.async_tmdb.run_sync(get_loop())
+        self.assertIs(self.async_tmdb.run_sync(get_loop()), loop)
+
+    async def test_run_sync_inside_event_loop(self):
+        with self.assertRaises(RuntimeError):
+            self.async_tmdb.run_sync(asyncio.sleep(0))
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    async def test_acquire_within_limit(self, mock_sleep):
+        for _ in range(self.async_tmdb.calls):
+            await self.async_tmdb._acquire()
+        mock_sleep.assert_not_awaited()
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    async def test_acquire_over_limit(self, mock_sleep):
+        for _ in range(self.async_tmdb.calls + 1):
+            await self.async_tmdb._acquire()
+        mock_sleep.assert_awaited_once()
+        self.assertAlmostEqual(mock_sleep.await_args.args[0], 1 / self.async_tmdb.calls, places=2)
+
+    @patch('aiohttp.TCPConnector')
+    @patch('aiohttp.ClientSession')
+    async def test_get_session_reused(self, mock_session, mock_connector):
+        mock_session.return_value.closed = False
+
+        session = await self.async_tmdb._get_session()
+        self.assertIs(await self.async_tmdb._get_session(), session)
+        mock_session.assert_called_once()
+
+    @patch('aiohttp.TCPConnector')
+    @patch('aiohttp.ClientSession')
+    async def test_aclose(self, mock_session, mock_connector):
+        mock_session.return_value.closed = False
+        mock_session.return_value.close = AsyncMock()
+
+        await self.async_tmdb._get_session()
+        await self.async_tmdb.aclose()
+        mock_session.return_value.close.assert_awaited_once()
+        self.assertIsNone(self.async_tmdb.session)
+
     @patch('aiohttp.ClientSession')
     async def test_fetch_data_success(self, mock_session):
         mock_response = AsyncMock()
@@ -346,6 +475,20 @@ class AsyncTMDBTests(TestCase):
             self.assertEqual(result, self.sample_movie)
             mock_session.return_value.get.assert_called_once_with('https://api.themoviedb.org/3/movie/1?language=en-US', timeout=10)
 
+    @patch('aiohttp.TCPConnector')
+    @patch('aiohttp.ClientSession')
+    async def test_fetch_data_opens_session(self, mock_session, mock_connector):
+        mock_response = AsyncMock()
+        mock_response.json = AsyncMock(return_value=self.sample_movie)
+        mock_response.raise_for_status = Mock(return_value=None)
+        mock_session.return_value.closed = False
+        mock_session.return_value.get.return_value.__aenter__.return_value = mock_response
+
+        self.assertIsNone(self.async_tmdb.session)
+        result = await self.async_tmdb._fetch_data('movie/1', is_by_id=True)
+        self.assertEqual(result, self.sample_movie)
+        mock_session.assert_called_once()
+
     @patch('aiohttp.ClientSession')
     async def test_batch_fetch(self, mock_session):
         mock_response = AsyncMock()
@@ -362,6 +505,34 @@ class AsyncTMDBTests(TestCase):
             mock_session.return_value.get.assert_any_call('https://api.themoviedb.org/3/movie/1?language=en-US', timeout=10)
             mock_session.return_value.get.assert_any_call('https://api.themoviedb.org/3/movie/2?language=en-US', timeout=10)
 
+    @patch('aiohttp.ClientSession')
+    async def test_batch_fetch_const_params(self, mock_session):
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=self.sample_movie)
+        mock_response.raise_for_status = Mock(return_value=None)
+        mock_session.return_value.get.return_value.__aenter__.return_value = mock_response
+
+        async with await self.async_tmdb._get_session():
+            results, not_fetched = await self.async_tmdb._batch_fetch(['movie/1', 'movie/2'], const_params={'language': 'en-US'})
+            self.assertEqual(results, [self.sample_movie, self.sample_movie])
+            mock_session.return_value.get.assert_any_call('https://api.themoviedb.org/3/movie/1?language=en-US', timeout=10)
+            mock_session.return_value.get.assert_any_call('https://api.themoviedb.org/3/movie/2?language=en-US', timeout=10)
+
+    @patch('aiohttp.ClientSession')
+    async def test_batch_fetch_duplicate_paths(self, mock_session):
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=self.sample_movie)
+        mock_response.raise_for_status = Mock(return_value=None)
+        mock_session.return_value.get.return_value.__aenter__.return_value = mock_response
+
+        async with await self.async_tmdb._get_session():
+            results, not_fetched = await self.async_tmdb._batch_fetch(['movie/1', 'movie/1'], const_params={'language': 'en-US'})
+            self.assertEqual(results, [self.sample_movie, self.sample_movie])
+            mock_session.return_value.get.assert_called_once_with('https://api.themoviedb.org/3/movie/1?language=en-US', timeout=10)
+            self.assertEqual(self.async_tmdb._inflight, {})
+
     @patch('aiohttp.ClientSession')
     async def test_fetch_by_id(self, mock_session):
         mock_response = AsyncMock()
@@ -436,6 +607,38 @@ class AsyncTMDBTests(TestCase):
             results = await self.async_tmdb._fetch_pages('movie/popular', first_page=1, last_page=2, language='en-US')
             self.assertEqual(results, [self.sample_page, self.sample_page])
 
+    @patch('aiohttp.ClientSession')
+    def test_fetch_many_pages(self, mock_session):
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=self.sample_page)
+        mock_response.raise_for_status = Mock(return_value=None)
+        mock_session.return_value.get.return_value.__aenter__.return_value = mock_response
+
+        specs = [
+            {'path': 'movie/popular', 'first_page': 1, 'last_page': 2},
+            {'path': 'movie/top_rated', 'first_page': 1, 'last_page': 1},
+        ]
+        results = self.async_tmdb.fetch_many_pages(specs)
+        self.assertEqual(results, [[self.sample_page, self.sample_page], [self.sample_page]])
+        self.assertEqual(mock_session.return_value.get.call_count, 3)
+
+    def test_iter_sync_closes_pages(self):
+        closed = []
+
+        async def pages():
+            try:
+                for page in range(1, 4):
+                    yield {'page': page}
+            finally:
+                closed.append(True)
+
+        for page in self.async_tmdb._iter_sync(pages()):
+            break
+
+        self.assertEqual(page, {'page': 1})
+        self.assertEqual(closed, [True])
+
     @patch('aiohttp.ClientSession')
     def test_fetch_popular_movies(self, mock_session):
         mock_response = AsyncMock()
@@ -10,19 +10,21 @@ from apps.services.utils import get_base_query, get_crew_map, unique_slugify
 class UniqueSlugifyTests(TestCase):
     """Tests for the unique_slugify function."""
 
+    @classmethod
+    def setUpTestData(cls):
+        Country.objects.create(code='US', name='United States')
+
     def test_normal_slug_generation(self):
         country = Country(code='CA', name='Canada')
         slug = unique_slugify(country, 'Canada')
         self.assertEqual(slug, 'canada')
 
     def test_duplicate_slug(self):
-        Country.objects.create(code='US', name='United States')
         country2 = Country(code='UK', name='United States')
         slug = unique_slugify(country2, 'United States')
         self.assertEqual(slug, 'united-states-1')
 
     def test_multiple_duplicate_slugs(self):
-        Country.objects.create(code='US', name='United States')
         Country.objects.create(code='UK', name='United States')
         country3 = Country(code='FR', name='United States')
         slug = unique_slugify(country3, 'United States')
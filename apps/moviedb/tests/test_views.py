@@ -1,17 +1,89 @@
-from django.test import Client, TestCase
-from django.urls import reverse
-from django.utils import timezone
+from datetime import date
+from importlib import import_module
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template import engines
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import get_resolver, resolve, reverse
 
 from apps.moviedb.models import Collection, Country, Genre, Language, Movie, MovieCast, MovieCrew, Person, ProductionCompany
+from apps.moviedb.views import CachedCountPaginator, ShufflePaginator
 from apps.services.utils import VERBOSE_SORT_BY_MOVIES, GenreIDs
 
+# Detail views cache objects and context, disable caching when counting queries
+NO_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+# Views cache counts, pages and objects, keep the cache local to the tests and clear it before each test
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-views'}}
+
+# Anonymous GET requests only, keep just what the views rely on (MovieListView uses the session)
+MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+HTMX_HEADERS = {'HTTP_HX_REQUEST': 'true'}
+
+MATRIX_RELEASE_DATE = date(1999, 3, 31)
+MATRIX_RELOADED_RELEASE_DATE = date(2003, 5, 15)
+
 
-class BaseTestCase(TestCase):
-    """Base test case with common setup for views."""
+@override_settings(MIDDLEWARE=MIDDLEWARE, CACHES=LOCMEM_CACHE)
+class ViewTests(TestCase):
+    """Tests for the moviedb views.
+
+    All views are tested in one class so the fixtures are built once per run instead of once per view.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # Load URLconf and template engines up front so their first-use cost doesn't land in the first test
+        get_resolver().url_patterns
+        for engine in engines.all():
+            engine.engine
+
+        cls.factory = RequestFactory()
+        cls.session_store = import_module(settings.SESSION_ENGINE).SessionStore
+        # Route names and kwargs are constant, resolve them once per class
+        cls.urls = {
+            'main': reverse('main'),
+            'movies_sort': reverse('movies_sort', kwargs={'sort_by': 'release_date'}),
+            'movies_shuffle': reverse('movies_sort', kwargs={'sort_by': 'shuffle'}),
+            'movies_sort_invalid': reverse('movies_sort', kwargs={'sort_by': 'title'}),
+            'movies_decade': reverse('movies_decade', kwargs={'sort_by': 'release_date', 'decade': '1990s'}),
+            'movies_year': reverse('movies_year', kwargs={'sort_by': 'release_date', 'decade': '1990s', 'year': 1999}),
+            'movies_country': reverse('movies_country', kwargs={'slug': 'united-states'}),
+            'movies_language': reverse('movies_language', kwargs={'slug': 'english'}),
+            'movies': reverse('movies'),
+            'movies_genre': reverse('movies_genre', kwargs={'slug': 'action'}),
+            'movie_detail': reverse('movie_detail', kwargs={'slug': 'the-matrix'}),
+            'movie_detail_invalid': reverse('movie_detail', kwargs={'slug': 'invalid'}),
+            'countries': reverse('countries'),
+            'languages': reverse('languages'),
+            'collections': reverse('collections'),
+            'collection_detail': reverse('collection_detail', kwargs={'slug': 'star-wars-collection'}),
+            'collection_detail_invalid': reverse('collection_detail', kwargs={'slug': 'invalid'}),
+            'companies': reverse('companies'),
+            'companies_sort': reverse('companies_sort', kwargs={'sort_by': 'movie_count'}),
+            'people': reverse('people'),
+            'people_department_sort': reverse('people_department_sort', kwargs={'department': 'directing', 'sort_by': 'tmdb_popularity'}),
+            'person_detail': reverse('person_detail', kwargs={'slug': 'john-doe'}),
+            'person_job': reverse('person_job', kwargs={'slug': 'john-doe', 'job': 'director'}),
+            'person_sort': reverse('person_sort', kwargs={'slug': 'john-doe', 'job': 'director', 'sort_by': 'release_date'}),
+            'person_detail_invalid': reverse('person_detail', kwargs={'slug': 'invalid'}),
+        }
+
+        # One full request against the fixtures to warm the remaining caches, use the reversed URL so the warmup
+        # can't silently turn into a redirect
+        response = cls.client_class().get(cls.urls['main'])
+        if response.status_code != 200:
+            raise AssertionError(f'Warmup request returned {response.status_code}, expected 200')
 
     @classmethod
     def setUpTestData(cls):
-        cls.client = Client()
         cls.country = Country.objects.create(code='US', name='United States', slug='united-states')
         cls.language = Language.objects.create(code='EN', name='English', slug='english')
         cls.genre = Genre.objects.create(tmdb_id=GenreIDs.ACTION, name='Action', slug='action')
@@ -26,279 +98,424 @@ class BaseTestCase(TestCase):
         cls.person = Person.objects.create(
             tmdb_id=1, name='John Doe', slug='john-doe', known_for_department='Directing', tmdb_popularity=75.0
         )
-        cls.movie = Movie.objects.create(
-            tmdb_id=1,
-            title='The Matrix',
-            slug='the-matrix',
-            release_date=timezone.datetime(1999, 3, 31).date(),
-            original_language=cls.language,
-            collection=cls.collection,
-            tmdb_popularity=85.0,
-            runtime=136,
-            status=6,
+        cls.movie, cls.movie2 = Movie.objects.bulk_create(
+            [
+                Movie(
+                    tmdb_id=1,
+                    title='The Matrix',
+                    slug='the-matrix',
+                    release_date=MATRIX_RELEASE_DATE,
+                    original_language=cls.language,
+                    collection=cls.collection,
+                    tmdb_popularity=85.0,
+                    genre_ids=[GenreIDs.ACTION],
+                    runtime=136,
+                    status=6,
+                ),
+                Movie(
+                    tmdb_id=2,
+                    title='The Matrix Reloaded',
+                    slug='the-matrix-reloaded',
+                    release_date=MATRIX_RELOADED_RELEASE_DATE,
+                    original_language=cls.language,
+                    collection=cls.collection,
+                    tmdb_popularity=80.0,
+                    genre_ids=[GenreIDs.ACTION],
+                    runtime=138,
+                    status=6,
+                ),
+            ]
+        )
+
+        # One INSERT per M2M table instead of a SELECT + INSERT per related object
+        movies = (cls.movie, cls.movie2)
+        Movie.genres.through.objects.bulk_create([Movie.genres.through(movie=movie, genre=cls.genre) for movie in movies])
+        Movie.origin_country.through.objects.bulk_create(
+            [Movie.origin_country.through(movie=movie, country=cls.country) for movie in movies]
         )
-        cls.movie2 = Movie.objects.create(
-            tmdb_id=2,
-            title='The Matrix Reloaded',
-            slug='the-matrix-reloaded',
-            release_date=timezone.datetime(2003, 5, 15).date(),
-            original_language=cls.language,
-            collection=cls.collection,
-            tmdb_popularity=80.0,
-            runtime=138,
-            status=6,
+        Movie.production_countries.through.objects.bulk_create(
+            [Movie.production_countries.through(movie=movie, country=cls.country) for movie in movies]
+        )
+        Movie.production_companies.through.objects.bulk_create(
+            [Movie.production_companies.through(movie=movie, productioncompany=cls.company) for movie in movies]
+        )
+        (cls.cast,) = MovieCast.objects.bulk_create([MovieCast(movie=cls.movie, person=cls.person, character='Neo', order=1)])
+        (cls.crew,) = MovieCrew.objects.bulk_create(
+            [MovieCrew(movie=cls.movie, person=cls.person, department='Directing', job='Director')]
         )
-        cls.movie.genres.add(cls.genre)
-        cls.movie2.genres.add(cls.genre)
-        cls.movie.origin_country.add(cls.country)
-        cls.movie2.origin_country.add(cls.country)
-        cls.movie.production_countries.add(cls.country)
-        cls.movie2.production_countries.add(cls.country)
-        cls.movie.production_companies.add(cls.company)
-        cls.movie2.production_companies.add(cls.company)
-        cls.cast = MovieCast.objects.create(movie=cls.movie, person=cls.person, character='Neo', order=1)
-        cls.crew = MovieCrew.objects.create(movie=cls.movie, person=cls.person, department='Directing', job='Director')
 
     def setUp(self):
-        self.client.get('/')
-
-
-class MovieListViewTests(BaseTestCase):
-    """Tests for the MovieListView."""
-
-    def test_get_main_view(self):
-        response = self.client.get(reverse('main'))
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertEqual(response.context['title'], 'Discover Movies')
-        self.assertEqual(response.context['list_type'], 'movies')
-        self.assertIn(self.movie, response.context['movies'])
-        self.assertEqual(response.context['sort_by'], '-tmdb_popularity')
-        self.assertEqual(response.context['decade'], 'any')
-
-    def test_get_movies_sort(self):
-        response = self.client.get(reverse('movies_sort', kwargs={'sort_by': 'release_date'}))
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertEqual(response.context['sort_by'], 'release_date')
-        self.assertEqual(response.context['verbose_sort_by'], VERBOSE_SORT_BY_MOVIES['release_date'])
+        cache.clear()
+
+    def call_view(self, url, data=None, **extra):
+        """Call the view resolved from ``url`` directly, skipping middleware and template rendering.
+
+        The response is left unrendered, assertions read ``context_data`` and ``template_name``.
+        Every call gets a fresh unsaved session, so session filters don't leak between calls.
+        """
+        match = resolve(url)
+        request = self.factory.get(url, data, **extra)
+        request.resolver_match = match
+        request.session = self.session_store()
+        return match.func(request, *match.args, **match.kwargs)
+
+    def htmx_call_view(self, url, **query):
+        """Same as ``call_view`` but sends the request as HTMX."""
+        return self.call_view(url, query, **HTMX_HEADERS)
+
+    def assertPkListed(self, obj, queryset):
+        """Assert ``obj`` is in ``queryset`` by fetching only primary keys instead of whole rows.
+
+        HTMX movie pages are cached as lists, their primary keys are read directly.
+        """
+        if isinstance(queryset, list):
+            self.assertIn(obj.pk, [item.pk for item in queryset])
+        else:
+            self.assertIn(obj.pk, queryset.values_list('pk', flat=True))
+
+    # MovieListView
+    def test_get_movie_list_variants(self):
+        # (case, url, GET data, is HTMX request, template, expected context, movie is listed)
+        cases = (
+            (
+                'main',
+                self.urls['main'],
+                {},
+                False,
+                'moviedb/main.html',
+                {'title': 'Discover Movies', 'list_type': 'movies', 'sort_by': '-tmdb_popularity', 'decade': 'any'},
+                True,
+            ),
+            (
+                'sort',
+                self.urls['movies_sort'],
+                {},
+                False,
+                'moviedb/main.html',
+                {'sort_by': 'release_date', 'verbose_sort_by': VERBOSE_SORT_BY_MOVIES['release_date']},
+                False,
+            ),
+            (
+                'decade',
+                self.urls['movies_decade'],
+                {},
+                False,
+                'moviedb/main.html',
+                {'decade': '1990s'},
+                True,
+            ),
+            (
+                'year',
+                self.urls['movies_year'],
+                {},
+                False,
+                'moviedb/main.html',
+                {'year': 1999, 'decade': '1990s'},
+                True,
+            ),
+            (
+                'country',
+                self.urls['movies_country'],
+                {},
+                False,
+                'moviedb/main.html',
+                {'title': 'United States', 'country': self.country},
+                True,
+            ),
+            (
+                'language_htmx',
+                self.urls['movies_language'],
+                {'query': 'matrix'},
+                True,
+                'moviedb/movies/partials/content_grid.html',
+                {'list_type': 'movies'},
+                True,
+            ),
+            (
+                'filters',
+                self.urls['movies'],
+                {'filter': ['hide_documentary']},
+                True,
+                'moviedb/movies/partials/content_grid.html',
+                {'list_type': 'movies'},
+                False,
+            ),
+            (
+                'genres',
+                self.urls['movies_genre'],
+                {'genres': ['Action']},
+                True,
+                'moviedb/movies/partials/content_grid.html',
+                {'list_type': 'movies'},
+                True,
+            ),
+        )
 
-    def test_get_movies_decade(self):
-        response = self.client.get(reverse('movies_decade', kwargs={'sort_by': 'release_date', 'decade': '1990s'}))
+        for case, url, data, htmx, template, expected_context, movie_listed in cases:
+            with self.subTest(case=case):
+                response = self.htmx_call_view(url, **data) if htmx else self.call_view(url, data)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.template_name[0], template)
+                for key, value in expected_context.items():
+                    self.assertEqual(response.context_data[key], value)
+                if htmx:
+                    # Only content grid is rendered, page context is skipped
+                    self.assertNotIn('filter_dict', response.context_data)
+                else:
+                    self.assertEqual(response.context_data['filter_dict']['hide_documentary'], 'Hide Documentary')
+                if movie_listed:
+                    self.assertPkListed(self.movie, response.context_data['movies'])
+
+    def test_movie_list_requires_all_genres(self):
+        response = self.htmx_call_view(self.urls['movies'], genres=['Action'])
+        self.assertPkListed(self.movie, response.context_data['movies'])
+
+        response = self.htmx_call_view(self.urls['movies'], genres=['Action', 'Drama'])
+        self.assertNotIn(self.movie.pk, [movie.pk for movie in response.context_data['movies']])
+
+    def test_movie_list_htmx_page_cache(self):
+        self.htmx_call_view(self.urls['movies'], genres=['Action'])
+        with self.assertNumQueries(0):
+            response = self.htmx_call_view(self.urls['movies'], genres=['Action'])
+        self.assertPkListed(self.movie, response.context_data['movies'])
+
+    def test_movie_list_unknown_genre(self):
+        response = self.client.get(self.urls['movies'], {'genres': ['Action', 'Unknown', '_empty']}, **HTMX_HEADERS)
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertEqual(response.context['decade'], '1990s')
-        self.assertIn(self.movie, response.context['movies'])
+        self.assertPkListed(self.movie, response.context['movies'])
+        self.assertEqual(self.client.session['genres'], ['Action'])
 
-    def test_get_movies_year(self):
-        response = self.client.get(reverse('movies_year', kwargs={'sort_by': 'release_date', 'decade': '1990s', 'year': 1999}))
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertEqual(response.context['year'], 1999)
-        self.assertEqual(response.context['decade'], '1990s')
-        self.assertIn(self.movie, response.context['movies'])
+    def test_movie_list_invalid_sort(self):
+        response = self.call_view(self.urls['movies_sort_invalid'])
+        self.assertEqual(response.context_data['sort_by'], '-tmdb_popularity')
+        self.assertEqual(response.context_data['verbose_sort_by'], VERBOSE_SORT_BY_MOVIES['-tmdb_popularity'])
 
-    def test_get_movies_country(self):
-        response = self.client.get(reverse('movies_country', kwargs={'slug': 'united-states'}))
+    def test_movie_list_shuffle(self):
+        response = self.call_view(self.urls['movies_shuffle'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertEqual(response.context['title'], 'United States')
-        self.assertEqual(response.context['country'], self.country)
-        self.assertIn(self.movie, response.context['movies'])
+        self.assertEqual(response.context_data['page_obj'].number, 1)
+        self.assertCountEqual([movie.pk for movie in response.context_data['movies']], [self.movie.pk, self.movie2.pk])
 
-    def test_get_movies_language_htmx(self):
-        response = self.client.get(reverse('movies_language', kwargs={'slug': 'english'}), {'query': 'matrix'}, HTTP_HX_REQUEST='true')
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/movies/partials/content_grid.html')
-        self.assertEqual(response.context['language'], self.language)
-        self.assertIn(self.movie, response.context['movies'])
+    def test_cached_count_paginator(self):
+        self.assertEqual(CachedCountPaginator(Movie.objects.order_by('pk'), 24).count, 2)
 
-    def test_get_movies_with_filters(self):
-        response = self.client.get(reverse('movies'), {'filter': ['hide_documentary']}, HTTP_HX_REQUEST='true')
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/movies/partials/content_grid.html')
-        self.assertEqual(response.context['filtered'], ['hide_documentary'])
-        self.assertEqual(response.context['filter_dict']['hide_documentary'], 'Hide Documentary')
-
-    def test_get_movies_with_genres(self):
-        response = self.client.get(reverse('movies_genre', kwargs={'slug': 'action'}), {'genres': ['Action']}, HTTP_HX_REQUEST='true')
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/movies/partials/content_grid.html')
-        self.assertEqual(response.context['genre'], self.genre)
-        self.assertIn(self.movie, response.context['movies'])
-        self.assertEqual(response.context['checked_genres'], ['Action'])
+        Movie.objects.create(tmdb_id=3, title='The Matrix Revolutions', slug='the-matrix-revolutions')
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(Movie.objects.order_by('pk'), 24).count, 2)
 
+    def test_shuffle_seed(self):
+        url = reverse('people_sort', kwargs={'sort_by': 'shuffle'})
+        # Two pages of people
+        Person.objects.bulk_create(
+            [Person(tmdb_id=100 + i, name=f'Person {i}', slug=f'person-{i}', tmdb_popularity=i) for i in range(24)]
+        )
 
-class MovieDetailViewTests(BaseTestCase):
-    """Tests for the MovieDetailView."""
+        # Every shuffle gets own seed, it's passed on in pagination links and session isn't touched
+        response = self.call_view(url)
+        seed = response.context_data['paginator'].seed
+        self.assertNotEqual(self.call_view(url).context_data['paginator'].seed, seed)
+        self.assertIn(f'seed={seed}', response.context_data['base_query'])
+        self.assertFalse(response.context_data['view'].request.session.modified)
+
+        # Next page keeps seed of the first one, so pages don't repeat people
+        next_response = self.call_view(url, {'seed': seed, 'page': 2})
+        self.assertEqual(next_response.context_data['paginator'].seed, seed)
+        self.assertEqual(
+            len({person.pk for person in response.context_data['people']} | {person.pk for person in next_response.context_data['people']}),
+            25,
+        )
 
+    def test_shuffle_paginator(self):
+        paginator = ShufflePaginator(Movie.objects.order_by('pk'), 1, seed=1)
+        paginator.count
+        # Only the mapped page is fetched
+        with self.assertNumQueries(1):
+            first_page = paginator.page(1)
+        second_page = paginator.page(2)
+        self.assertEqual(first_page.number, 1)
+        self.assertCountEqual([first_page[0].pk, second_page[0].pk], [self.movie.pk, self.movie2.pk])
+
+    def test_movie_list_search_summed_similarity(self):
+        # 'mat' is 0.25 similar to 'The Matrix' and 0.14 to 'The Matrix Reloaded', which counts twice when
+        # original title is the same, both are below pg_trgm default threshold of 0.3 but their sums are above 0.2
+        Movie.objects.filter(pk=self.movie2.pk).update(original_title='The Matrix Reloaded')
+        response = self.htmx_call_view(self.urls['movies'], query='mat')
+        self.assertPkListed(self.movie, response.context_data['movies'])
+        self.assertPkListed(self.movie2, response.context_data['movies'])
+
+    @override_settings(CACHES=NO_CACHE)
+    def test_cached_count_paginator_deep_page(self):
+        paginator = CachedCountPaginator(Movie.objects.order_by('-pk'), 1)
+        paginator.deep_page_offset = 1
+        self.assertEqual([obj.pk for obj in paginator.page(1)], [self.movie2.pk])
+        self.assertEqual([obj.pk for obj in paginator.page(2)], [self.movie.pk])
+
+    # MovieDetailView
+    @override_settings(CACHES=NO_CACHE)
     def test_get_movie_detail(self):
-        response = self.client.get(reverse('movie_detail', kwargs={'slug': 'the-matrix'}))
+        # movie + language/collection join, 5 M2M prefetches, collection movies, cast, crew
+        with self.assertNumQueries(9):
+            response = self.client.get(self.urls['movie_detail'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/movies/movie_detail.html')
+        self.assertEqual(response.templates[0].name, 'moviedb/movies/movie_detail.html')
         self.assertEqual(response.context['movie'], self.movie)
         self.assertEqual(response.context['title'], 'The Matrix - 1999')
-        self.assertIn(self.genre, response.context['genres'])
-        self.assertIn(self.country, response.context['countries'])
-        self.assertIn(self.company, response.context['companies'])
-        self.assertIn(self.cast, response.context['cast'])
+        self.assertIn(self.genre.pk, {obj.pk for obj in response.context['genres']})
+        self.assertIn(self.country.pk, {obj.pk for obj in response.context['countries']})
+        self.assertIn(self.company.pk, {obj.pk for obj in response.context['companies']})
+        self.assertIn(self.cast.pk, {obj.pk for obj in response.context['cast']})
         self.assertIn(self.person.tmdb_id, response.context['crew_map']['Director']['objs'])
 
     def test_get_movie_detail_invalid_slug(self):
-        response = self.client.get(reverse('movie_detail', kwargs={'slug': 'invalid'}))
+        response = self.client.get(self.urls['movie_detail_invalid'])
         self.assertEqual(response.status_code, 404)
 
-
-class CountryListViewTests(BaseTestCase):
-    """Tests for the CountryListView."""
-
+    # CountryListView
     def test_get_countries(self):
-        response = self.client.get(reverse('countries'))
+        response = self.call_view(self.urls['countries'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other.html')
-        self.assertEqual(response.context['title'], 'Countries')
-        self.assertEqual(response.context['list_type'], 'countries')
-        self.assertIn(self.country, response.context['countries'])
+        self.assertEqual(response.template_name[0], 'moviedb/other.html')
+        self.assertEqual(response.context_data['title'], 'Countries')
+        self.assertEqual(response.context_data['list_type'], 'countries')
+        self.assertPkListed(self.country, response.context_data['countries'])
 
     def test_get_countries_search(self):
-        response = self.client.get(reverse('countries'), {'query': 'united'})
+        response = self.call_view(self.urls['countries'], {'query': 'united'})
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other/partials/content_grid.html')
-        self.assertIn(self.country, response.context['countries'])
-
-
-class LanguageListViewTests(BaseTestCase):
-    """Tests for the LanguageListView."""
+        self.assertEqual(response.template_name[0], 'moviedb/other/partials/content_grid.html')
+        self.assertPkListed(self.country, response.context_data['countries'])
 
+    # LanguageListView
     def test_get_languages(self):
-        response = self.client.get(reverse('languages'))
+        response = self.call_view(self.urls['languages'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other.html')
-        self.assertEqual(response.context['title'], 'Languages')
-        self.assertEqual(response.context['list_type'], 'languages')
-        self.assertIn(self.language, response.context['languages'])
+        self.assertEqual(response.template_name[0], 'moviedb/other.html')
+        self.assertEqual(response.context_data['title'], 'Languages')
+        self.assertEqual(response.context_data['list_type'], 'languages')
+        self.assertPkListed(self.language, response.context_data['languages'])
 
     def test_get_languages_search_htmx(self):
-        response = self.client.get(reverse('languages'), {'query': 'english'}, HTTP_HX_REQUEST='true')
+        response = self.htmx_call_view(self.urls['languages'], query='english')
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other/partials/content_grid.html')
-        self.assertIn(self.language, response.context['languages'])
-
-
-class CollectionsListViewTests(BaseTestCase):
-    """Tests for the CollectionsListView."""
+        self.assertEqual(response.template_name[0], 'moviedb/other/partials/content_grid.html')
+        self.assertPkListed(self.language, response.context_data['languages'])
 
+    # CollectionsListView
     def test_get_collections(self):
-        response = self.client.get(reverse('collections'))
+        response = self.call_view(self.urls['collections'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other.html')
-        self.assertEqual(response.context['title'], 'Collections')
-        self.assertEqual(response.context['list_type'], 'collections')
-        self.assertIn(self.collection, response.context['collections'])
+        self.assertEqual(response.template_name[0], 'moviedb/other.html')
+        self.assertEqual(response.context_data['title'], 'Collections')
+        self.assertEqual(response.context_data['list_type'], 'collections')
+        self.assertPkListed(self.collection, response.context_data['collections'])
 
     def test_get_collections_search(self):
-        response = self.client.get(reverse('collections'), {'query': 'star wars'}, HTTP_HX_REQUEST='true')
+        response = self.htmx_call_view(self.urls['collections'], query='star wars')
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other/partials/content_grid.html')
-        self.assertIn(self.collection, response.context['collections'])
-
+        self.assertEqual(response.template_name[0], 'moviedb/other/partials/content_grid.html')
+        self.assertPkListed(self.collection, response.context_data['collections'])
 
-class CollectionDetailViewTests(BaseTestCase):
-    """Tests for the CollectionDetailView."""
+    def test_get_collections_search_low_similarity(self):
+        # 'wars' is about 0.24 similar to 'Star Wars Collection', below pg_trgm default threshold of 0.3
+        response = self.htmx_call_view(self.urls['collections'], query='wars')
+        self.assertPkListed(self.collection, response.context_data['collections'])
 
+    # CollectionDetailView
+    @override_settings(CACHES=NO_CACHE)
     def test_get_collection_detail(self):
-        response = self.client.get(reverse('collection_detail', kwargs={'slug': 'star-wars-collection'}))
+        # collection, movies
+        with self.assertNumQueries(2):
+            response = self.client.get(self.urls['collection_detail'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other/collection_detail.html')
+        self.assertEqual(response.templates[0].name, 'moviedb/other/collection_detail.html')
         self.assertEqual(response.context['collection'], self.collection)
         self.assertEqual(response.context['title'], 'Star Wars Collection')
-        self.assertIn(self.movie, response.context['movies'])
+        self.assertIn(self.movie.pk, {obj.pk for obj in response.context['movies']})
 
     def test_get_collection_detail_invalid_slug(self):
-        response = self.client.get(reverse('collection_detail', kwargs={'slug': 'invalid'}))
+        response = self.client.get(self.urls['collection_detail_invalid'])
         self.assertEqual(response.status_code, 404)
 
-
-class CompanyListViewTests(BaseTestCase):
-    """Tests for the CompanyListView."""
-
+    # CompanyListView
     def test_get_companies(self):
-        response = self.client.get(reverse('companies'))
+        response = self.call_view(self.urls['companies'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other.html')
-        self.assertEqual(response.context['title'], 'Production Companies')
-        self.assertEqual(response.context['list_type'], 'companies')
-        self.assertIn(self.company, response.context['companies'])
+        self.assertEqual(response.template_name[0], 'moviedb/other.html')
+        self.assertEqual(response.context_data['title'], 'Production Companies')
+        self.assertEqual(response.context_data['list_type'], 'companies')
+        self.assertPkListed(self.company, response.context_data['companies'])
 
     def test_get_companies_sort(self):
-        response = self.client.get(reverse('companies_sort', kwargs={'sort_by': 'movie_count'}))
+        response = self.call_view(self.urls['companies_sort'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other.html')
-        self.assertEqual(response.context['sort_by'], 'movie_count')
-        self.assertEqual(response.context['verbose_sort_by'], 'Number of movies ↓')
+        self.assertEqual(response.template_name[0], 'moviedb/other.html')
+        self.assertEqual(response.context_data['sort_by'], 'movie_count')
+        self.assertEqual(response.context_data['verbose_sort_by'], 'Number of movies ↓')
 
     def test_get_companies_search(self):
-        response = self.client.get(reverse('companies'), {'query': 'paramount'}, HTTP_HX_REQUEST='true')
+        response = self.htmx_call_view(self.urls['companies'], query='paramount')
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/other/partials/content_grid.html')
-        self.assertIn(self.company, response.context['companies'])
-
-
-class PeopleListViewTests(BaseTestCase):
-    """Tests for the PeopleListView."""
+        self.assertEqual(response.template_name[0], 'moviedb/other/partials/content_grid.html')
+        self.assertPkListed(self.company, response.context_data['companies'])
 
+    # PeopleListView
     def test_get_people(self):
-        response = self.client.get(reverse('people'))
+        response = self.call_view(self.urls['people'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertEqual(response.context['title'], 'People')
-        self.assertEqual(response.context['list_type'], 'people')
-        self.assertIn(self.person, response.context['people'])
+        self.assertEqual(response.template_name[0], 'moviedb/main.html')
+        self.assertEqual(response.context_data['title'], 'People')
+        self.assertEqual(response.context_data['list_type'], 'people')
+        self.assertPkListed(self.person, response.context_data['people'])
 
     def test_get_people_department_sort(self):
-        response = self.client.get(reverse('people_department_sort', kwargs={'department': 'directing', 'sort_by': 'tmdb_popularity'}))
+        response = self.call_view(self.urls['people_department_sort'])
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertEqual(response.context['department'], 'directing')
-        self.assertEqual(response.context['verbose_department'], 'Directing')
-        self.assertIn(self.person, response.context['people'])
+        self.assertEqual(response.template_name[0], 'moviedb/main.html')
+        self.assertEqual(response.context_data['department'], 'directing')
+        self.assertEqual(response.context_data['verbose_department'], 'Directing')
+        self.assertPkListed(self.person, response.context_data['people'])
 
     def test_get_people_search(self):
-        response = self.client.get(reverse('people'), {'query': 'john'})
+        response = self.call_view(self.urls['people'], {'query': 'john'})
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/main.html')
-        self.assertIn(self.person, response.context['people'])
-
-
-class PersonDetailViewTests(BaseTestCase):
-    """Tests for the PersonDetailView."""
-
-    def test_get_person_detail(self):
-        response = self.client.get(reverse('person_detail', kwargs={'slug': 'john-doe'}))
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/people/person_detail.html')
-        self.assertEqual(response.context['person'], self.person)
-        self.assertEqual(response.context['title'], 'John Doe')
-        self.assertEqual(response.context['known_for'], 'Directing')
-        self.assertIn('Director', response.context['roles_map'])
-        self.assertIn('Actor', response.context['roles_map'])
-        self.assertIn(self.movie.tmdb_id, response.context['roles_map']['Director']['objs'])
-        self.assertIn(self.movie.tmdb_id, response.context['roles_map']['Actor']['objs'])
-
-    def test_get_person_job(self):
-        response = self.client.get(reverse('person_job', kwargs={'slug': 'john-doe', 'job': 'director'}))
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/people/person_detail.html')
-        self.assertEqual(response.context['role_type'], 'Director')
-        self.assertIn(self.movie, response.context['movies'])
+        self.assertEqual(response.template_name[0], 'moviedb/main.html')
+        self.assertPkListed(self.person, response.context_data['people'])
+
+    # PersonDetailView
+    def test_get_person_detail_variants(self):
+        cases = (
+            (
+                'detail',
+                self.urls['person_detail'],
+                {'person': self.person, 'title': 'John Doe', 'known_for': 'Directing', 'role_type': 'Director'},
+            ),
+            (
+                'job',
+                self.urls['person_job'],
+                {'role_type': 'Director'},
+            ),
+            (
+                'sort',
+                self.urls['person_sort'],
+                {'sort_by': 'release_date', 'verbose_sort_by': VERBOSE_SORT_BY_MOVIES['release_date']},
+            ),
+        )
 
-    def test_get_person_sort(self):
-        response = self.client.get(reverse('person_sort', kwargs={'slug': 'john-doe', 'job': 'director', 'sort_by': 'release_date'}))
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'moviedb/people/person_detail.html')
-        self.assertEqual(response.context['sort_by'], 'release_date')
-        self.assertEqual(response.context['verbose_sort_by'], VERBOSE_SORT_BY_MOVIES['release_date'])
+        for case, url, expected_context in cases:
+            with self.subTest(case=case):
+                # person, crew roles, cast roles
+                with self.assertNumQueries(3):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.templates[0].name, 'moviedb/people/person_detail.html')
+                for key, value in expected_context.items():
+                    self.assertEqual(response.context[key], value)
+                self.assertIn('Director', response.context['roles_map'])
+                self.assertIn('Actor', response.context['roles_map'])
+                self.assertIn(self.movie.tmdb_id, response.context['roles_map']['Director']['objs'])
+                self.assertIn(self.movie.tmdb_id, response.context['roles_map']['Actor']['objs'])
+                self.assertIn(self.movie.pk, {obj.pk for obj in response.context['movies']})
 
     def test_get_person_detail_invalid_slug(self):
-        response = self.client.get(reverse('person_detail', kwargs={'slug': 'invalid'}))
+        response = self.client.get(self.urls['person_detail_invalid'])
         self.assertEqual(response.status_code, 404)
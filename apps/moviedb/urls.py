@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import include, path
 
 from .views import (
     CollectionDetailView,
@@ -12,68 +12,92 @@ from .views import (
     PersonDetailView,
 )
 
+# Movie lists filtered by an object: URL prefix, filter type used in route names and route of the first page
+# (language one has no trailing slash)
+MOVIE_FILTER_ROUTES = (
+    ('movies-by-country/', 'country', '<slug:slug>/'),
+    ('movies-by-language/', 'language', '<slug:slug>'),
+    ('production-company/', 'company', '<slug:slug>/'),
+    ('genre/', 'genre', '<slug:slug>/'),
+)
+
+movie_filter_patterns = [
+    path(
+        prefix,
+        include(
+            [
+                path(first_page_route, MovieListView.as_view(), name=f'movies_{filter_type}'),
+                path(
+                    '<slug:slug>/by/<str:sort_by>/decade/<str:decade>/',
+                    MovieListView.as_view(),
+                    name=f'movies_decade_{filter_type}',
+                ),
+                path(
+                    '<slug:slug>/by/<str:sort_by>/decade/<str:decade>/year/<int:year>/',
+                    MovieListView.as_view(),
+                    name=f'movies_year_{filter_type}',
+                ),
+            ]
+        ),
+    )
+    for prefix, filter_type, first_page_route in MOVIE_FILTER_ROUTES
+]
+
 urlpatterns = [
     path('', MovieListView.as_view(), name='main'),
-    path('movies/', MovieListView.as_view(), name='movies'),
-    path('movies/by/<str:sort_by>', MovieListView.as_view(), name='movies_sort'),
-    path('movies/by/<str:sort_by>/decade/<str:decade>', MovieListView.as_view(), name='movies_decade'),
-    path('movies/by/<str:sort_by>/decade/<str:decade>/year/<int:year>', MovieListView.as_view(), name='movies_year'),
+    path(
+        'movies/',
+        include(
+            [
+                path('', MovieListView.as_view(), name='movies'),
+                path('by/<str:sort_by>', MovieListView.as_view(), name='movies_sort'),
+                path('by/<str:sort_by>/decade/<str:decade>', MovieListView.as_view(), name='movies_decade'),
+                path(
+                    'by/<str:sort_by>/decade/<str:decade>/year/<int:year>',
+                    MovieListView.as_view(),
+                    name='movies_year',
+                ),
+            ]
+        ),
+    ),
     path('movie/<slug:slug>/', MovieDetailView.as_view(), name='movie_detail'),
     path('other/', CountryListView.as_view(), name='other'),
     path('countries/', CountryListView.as_view(), name='countries'),
     path('languages/', LanguageListView.as_view(), name='languages'),
     path('collections/', CollectionsListView.as_view(), name='collections'),
     path('collection/<slug:slug>/', CollectionDetailView.as_view(), name='collection_detail'),
-    path('production-companies/', CompanyListView.as_view(), name='companies'),
-    path('production-companies/by/<str:sort_by>', CompanyListView.as_view(), name='companies_sort'),
-    path('movies-by-country/<slug:slug>/', MovieListView.as_view(), name='movies_country'),
-    path(
-        'movies-by-country/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/',
-        MovieListView.as_view(),
-        name='movies_decade_country',
-    ),
-    path(
-        'movies-by-country/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/year/<int:year>/',
-        MovieListView.as_view(),
-        name='movies_year_country',
-    ),
-    path('movies-by-language/<slug:slug>', MovieListView.as_view(), name='movies_language'),
-    path(
-        'movies-by-language/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/',
-        MovieListView.as_view(),
-        name='movies_decade_language',
-    ),
-    path(
-        'movies-by-language/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/year/<int:year>/',
-        MovieListView.as_view(),
-        name='movies_year_language',
-    ),
-    path('production-company/<slug:slug>/', MovieListView.as_view(), name='movies_company'),
-    path(
-        'production-company/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/',
-        MovieListView.as_view(),
-        name='movies_decade_company',
-    ),
     path(
-        'production-company/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/year/<int:year>/',
-        MovieListView.as_view(),
-        name='movies_year_company',
+        'production-companies/',
+        include(
+            [
+                path('', CompanyListView.as_view(), name='companies'),
+                path('by/<str:sort_by>', CompanyListView.as_view(), name='companies_sort'),
+            ]
+        ),
     ),
-    path('genre/<slug:slug>/', MovieListView.as_view(), name='movies_genre'),
+    *movie_filter_patterns,
     path(
-        'genre/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/',
-        MovieListView.as_view(),
-        name='movies_decade_genre',
+        'people/',
+        include(
+            [
+                path('', PeopleListView.as_view(), name='people'),
+                path('by/<str:sort_by>/', PeopleListView.as_view(), name='people_sort'),
+                path(
+                    'department/<str:department>/by/<str:sort_by>/',
+                    PeopleListView.as_view(),
+                    name='people_department_sort',
+                ),
+            ]
+        ),
     ),
     path(
-        'genre/<slug:slug>/by/<str:sort_by>/decade/<str:decade>/year/<int:year>/',
-        MovieListView.as_view(),
-        name='movies_year_genre',
+        'person/<slug:slug>/',
+        include(
+            [
+                path('', PersonDetailView.as_view(), name='person_detail'),
+                path('<str:job>', PersonDetailView.as_view(), name='person_job'),
+                path('<str:job>/by/<str:sort_by>', PersonDetailView.as_view(), name='person_sort'),
+            ]
+        ),
     ),
-    path('people/', PeopleListView.as_view(), name='people'),
-    path('people/by/<str:sort_by>/', PeopleListView.as_view(), name='people_sort'),
-    path('people/department/<str:department>/by/<str:sort_by>/', PeopleListView.as_view(), name='people_department_sort'),
-    path('person/<slug:slug>/', PersonDetailView.as_view(), name='person_detail'),
-    path('person/<slug:slug>/<str:job>', PersonDetailView.as_view(), name='person_job'),
-    path('person/<slug:slug>/<str:job>/by/<str:sort_by>', PersonDetailView.as_view(), name='person_sort'),
 ]
@@ -1,10 +1,17 @@
 import logging
+import re
 from datetime import date
-from random import shuffle
+from hashlib import blake2b
+from math import gcd
+from random import Random, randint, shuffle
 
 from django.contrib.postgres.search import TrigramSimilarity
 from django.core.cache import cache
-from django.db.models import F, Q
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
 from django.views.generic import DetailView, ListView
 
 from apps.services.utils import GENRE_DICT, VERBOSE_SORT_BY_MOVIES, GenreIDs, get_base_query, get_crew_map
@@ -14,12 +21,160 @@ from .models import Collection, Country, Genre, Language, Movie, Person, Product
 
 logger = logging.getLogger('moviedb')
 
+# Valid decades, 1880s-2020s
+DECADE_RE = re.compile(r'(18[89]0|19\d0|20[012]0)s')
 
-class MovieListView(ListView):
+# Movie fields used in movie grid
+MOVIE_GRID_FIELDS = ('slug', 'title', 'poster_path', 'release_date')
+
+
+class TrigramSearchMixin:
+    """Search with pg_trgm similarity.
+
+    Search requests are handled in a transaction and similarity threshold of `%` operator is set only for it, so the
+    threshold doesn't leak to other requests through persistent or pooled connections.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if not request.GET.get('query'):
+            return super().get(request, *args, **kwargs)
+
+        # Objects are fetched when the page is rendered, render it before the transaction ends
+        with transaction.atomic():
+            return super().get(request, *args, **kwargs).render()
+
+    def trigram_search(self, queryset, fields, query, threshold):
+        """Filter objects whose summed trigram similarity of `fields` to `query` is above `threshold`, most similar first.
+
+        Objects are first matched with `%` operator, so trigram GIN indexes of `fields` are used and similarity is
+        computed only for matched objects.
+        """
+
+        # If the sum of similarities is above `threshold`, at least one field reaches `threshold` split between fields,
+        # so with the split threshold the operator doesn't drop any result
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT set_config('pg_trgm.similarity_threshold', %s, true)", [str(threshold / len(fields))])
+
+        match = Q()
+        similarity = None
+        for field in fields:
+            match |= Q(**{f'{field}__trigram_similar': query})
+            field_similarity = TrigramSimilarity(field, query)
+            similarity = field_similarity if similarity is None else similarity + field_similarity
+
+        return queryset.filter(match).annotate(similarity=similarity).filter(similarity__gt=threshold).order_by('-similarity')
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that keeps total count in cache for a few minutes.
+
+    COUNT over filtered movies is one of the most expensive queries of list views and the same filters are requested
+    over and over, count is cached by SQL of the queryset. Ordering doesn't affect count, so it's dropped from the
+    key and every sort option of the same filters shares one cached count.
+    """
+
+    count_cache_timeout = 60 * 5
+    deep_page_offset = 500
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+
+        try:
+            sql = str(self.object_list.order_by().query)
+        except EmptyResultSet:
+            return 0
+
+        cache_key = f'cached_count:{blake2b(sql.encode(), digest_size=16).hexdigest()}'
+        count = cache.get(cache_key)
+        if count is None:
+            count = super().count
+            cache.set(cache_key, count, self.count_cache_timeout)
+
+        return count
+
+    def page(self, number):
+        """Fetch deep pages in two steps: pks of the page window first, then full rows by these pks.
+
+        OFFSET makes database build and discard every row before the page, so for deep pages only pks are skipped.
+        """
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+
+        if not isinstance(self.object_list, QuerySet) or bottom < self.deep_page_offset:
+            return super().page(number)
+
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        positions = {pk: i for i, pk in enumerate(pks)}
+        objects = sorted(self.object_list.order_by().filter(pk__in=pks), key=lambda obj: positions[obj.pk])
+
+        return self._get_page(objects, number, self)
+
+
+class ShufflePaginator(CachedCountPaginator):
+    """Paginator that shows objects of a random page in random order instead of the requested page.
+
+    Pages are mapped to random pages with a permutation seeded by `seed`, so going through pages doesn't repeat
+    objects and the same page shows the same objects. Only the mapped page is fetched.
+    """
+
+    def __init__(self, *args, seed, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seed = seed
+
+    def page(self, number):
+        number = self.validate_number(number)
+        rng = Random(self.seed)
+
+        # Permutation of pages: i -> (step * i + shift) mod num_pages, step is coprime with num_pages
+        num_pages = self.num_pages
+        step = rng.randint(1, num_pages)
+        while gcd(step, num_pages) != 1:
+            step += 1
+        shift = rng.randrange(num_pages)
+
+        objects = list(super().page((step * (number - 1) + shift) % num_pages + 1).object_list)
+        rng.shuffle(objects)
+
+        return self._get_page(objects, number, self)
+
+
+class ShuffleMixin:
+    """Shuffle list without ORDER BY RANDOM().
+
+    If `shuffle` is set in `get_queryset`, the queryset should be ordered by an indexed field. Each page then shows
+    objects of a random page of that ordering in random order, so the database doesn't have to generate a random
+    value for every row and sort all of them. Requested page number is kept for pagination links.
+
+    Each shuffle gets a new seed, it's passed on in pagination links (`seed` query parameter), so the following pages
+    keep the same order and nothing is stored in session. The view has to set `base_query` before paginating.
+    """
+
+    shuffle = False
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        if not self.shuffle:
+            return super().get_paginator(queryset, per_page, **kwargs)
+
+        seed = self.request.GET.get('seed', '')
+        seed = int(seed) if seed.isdigit() and len(seed) <= 10 else randint(0, 2**32 - 1)
+        self.base_query = f'{self.base_query}&seed={seed}' if self.base_query else f'seed={seed}'
+
+        return ShufflePaginator(queryset, per_page, seed=seed, **kwargs)
+
+
+class MovieListView(TrigramSearchMixin, ShuffleMixin, ListView):
     template_name = 'moviedb/main.html'
     context_object_name = 'movies'
     form = SearchForm()
     paginate_by = 24
+    paginator_class = CachedCountPaginator
 
     FILTER_DICT = {
         'show_documentary': 'Show Documentary',
@@ -32,6 +187,66 @@ class MovieListView(ListView):
         'hide_unreleased': 'Hide Unreleased',
     }
 
+    # Fields movies can be sorted by and movies excluded when sorting by them (ones without a value)
+    SORT_EXCLUDES = {
+        'tmdb_popularity': None,
+        'release_date': {'release_date': None},
+        'budget': {'budget': 0},
+        'revenue': {'revenue': 0},
+        'runtime': {'runtime': 0},
+    }
+
+    # Filter type of routes of movie lists filtered by country/language/production company/genre
+    FILTER_TYPE_BY_ROUTE = {
+        f'movies{route_type}_{filter_type}': filter_type
+        for filter_type in ('country', 'language', 'company', 'genre')
+        for route_type in ('', '_decade', '_year')
+    }
+
+    # Dropdown options, same for every request
+    DECADE_LIST = tuple(f'{decade}s' for decade in range(2020, 1879, -10))
+    GENRES_LIST = tuple(GENRE_DICT)
+
+    # HTMX requests re-render movie grid on every filter change, cache page movies for a few minutes
+    page_cache_timeout = 60 * 5
+
+    def paginate_queryset(self, queryset, page_size):
+        """Get page movies of HTMX requests from cache, keyed by SQL of the page, it includes all filters and sorting.
+
+        Shuffled pages are not cached.
+        """
+
+        paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+
+        if self.request.headers.get('HX-Request') and isinstance(page.object_list, QuerySet):
+            try:
+                sql = str(page.object_list.query)
+            except EmptyResultSet:
+                return paginator, page, object_list, is_paginated
+
+            cache_key = f'cached_movies_page:{blake2b(sql.encode(), digest_size=16).hexdigest()}'
+            object_list = cache.get(cache_key)
+            if object_list is None:
+                object_list = list(page.object_list)
+                cache.set(cache_key, object_list, self.page_cache_timeout)
+            page.object_list = object_list
+
+        return paginator, page, object_list, is_paginated
+
+    def get_filter_obj(self, model, *extra_fields):
+        """Get object movies are filtered by, it's cached since the same few objects are requested over and over.
+
+        Only fields used by the page are loaded: pk to filter movies, name for title, slug for URLs and `extra_fields`.
+        """
+
+        cache_key = f'cached_{self.filter_type}:{self.slug}'
+        obj = cache.get(cache_key)
+        if obj is None:
+            obj = model.objects.only('pk', 'name', 'slug', *extra_fields).get(slug=self.slug)
+            cache.set(cache_key, obj, 60 * 60)
+
+        return obj
+
     def get_queryset(self):
         # Filter by country/language/production company
         if self.filter_type:
@@ -39,16 +254,16 @@ class MovieListView(ListView):
             self.slug = self.kwargs.get('slug', '')
             match self.filter_type:
                 case 'country':
-                    self.filter_obj = Country.objects.get(slug=self.slug)
+                    self.filter_obj = self.get_filter_obj(Country)
                     queryset = self.filter_obj.movies_originating_from.all()
                 case 'language':
-                    self.filter_obj = Language.objects.get(slug=self.slug)
+                    self.filter_obj = self.get_filter_obj(Language)
                     queryset = self.filter_obj.movies_as_original_language.all()
                 case 'company':
-                    self.filter_obj = ProductionCompany.objects.get(slug=self.slug)
+                    self.filter_obj = self.get_filter_obj(ProductionCompany, 'logo_path')
                     queryset = self.filter_obj.movies.all()
                 case 'genre':
-                    self.filter_obj = Genre.objects.get(slug=self.slug)
+                    self.filter_obj = self.get_filter_obj(Genre)
                     queryset = self.filter_obj.movies.all()
         else:
             queryset = Movie.objects.all()
@@ -57,7 +272,8 @@ class MovieListView(ListView):
 
         self.year = self.kwargs.get('year', 0)
         self.decade = 'any'
-        self.sort_by = self.kwargs.get('sort_by', '-tmdb_popularity')
+        sort_by = self.kwargs.get('sort_by', '-tmdb_popularity')
+        self.sort_by = sort_by if sort_by in VERBOSE_SORT_BY_MOVIES else '-tmdb_popularity'
 
         # Search
         if 'query' in self.request.GET and self.request.GET.get('query'):
@@ -65,13 +281,7 @@ class MovieListView(ListView):
             if self.form.is_valid():
                 query = self.form.cleaned_data['query']
 
-                queryset = (
-                    queryset.annotate(
-                        similarity=TrigramSimilarity('title', query) + TrigramSimilarity('original_title', query),
-                    )
-                    .filter(similarity__gt=0.2)
-                    .order_by('-similarity')
-                )
+                queryset = self.trigram_search(queryset, ('title', 'original_title'), query, 0.2)
         else:
             if not self.filter_type or self.filter_type != 'company':
                 queryset = queryset.filter(adult=False)
@@ -82,77 +292,91 @@ class MovieListView(ListView):
                 self.decade = f'{self.year // 10}0s'
             else:
                 self.decade = self.kwargs.get('decade', 'any')
-                if self.decade != 'any':
-                    try:
-                        decade_int = int(self.decade[:-1])
-                    except ValueError:
-                        decade_int = 0
-
-                    if 1880 <= decade_int <= 2020 and decade_int % 10 == 0:
-                        start_date = f'{decade_int}-01-01'
-                        end_date = f'{decade_int + 9}-12-31'
-                        queryset = queryset.filter(release_date__range=(start_date, end_date))
-                    else:
-                        self.decade = 'any'
+                if DECADE_RE.fullmatch(self.decade):
+                    decade_int = int(self.decade[:-1])
+                    queryset = queryset.filter(
+                        release_date__gte=date(decade_int, 1, 1),
+                        release_date__lt=date(decade_int + 10, 1, 1),
+                    )
+                else:
+                    self.decade = 'any'
+
+            # Genres movies must have and genres they must not have, applied at once after filters
+            required_genre_ids = set()
+            excluded_genre_ids = []
+
+            # Read session once, filters as a set for membership checks
+            session = self.request.session
+            filters = set(session.get('filter', ()))
+            genres = session.get('genres')
 
             # Apply filters
-            if 'filter' in self.request.session:
-                if 'show_documentary' in self.request.session['filter']:
-                    queryset = queryset.filter(genres__tmdb_id=GenreIDs.DOCUMENTARY)
-                elif 'hide_documentary' in self.request.session['filter']:
-                    queryset = queryset.exclude(genres__tmdb_id=GenreIDs.DOCUMENTARY)
-                if 'show_tv_movie' in self.request.session['filter']:
-                    queryset = queryset.filter(genres__tmdb_id=GenreIDs.TV_MOVIE)
-                elif 'hide_tv_movie' in self.request.session['filter']:
-                    queryset = queryset.exclude(genres__tmdb_id=GenreIDs.TV_MOVIE)
-                if 'show_short' in self.request.session['filter']:
+            if filters:
+                if 'show_documentary' in filters:
+                    required_genre_ids.add(GenreIDs.DOCUMENTARY)
+                elif 'hide_documentary' in filters:
+                    excluded_genre_ids.append(GenreIDs.DOCUMENTARY)
+                if 'show_tv_movie' in filters:
+                    required_genre_ids.add(GenreIDs.TV_MOVIE)
+                elif 'hide_tv_movie' in filters:
+                    excluded_genre_ids.append(GenreIDs.TV_MOVIE)
+                if 'show_short' in filters:
                     queryset = queryset.filter(short=True)
-                elif 'hide_short' in self.request.session['filter']:
+                elif 'hide_short' in filters:
                     queryset = queryset.exclude(short=True)
-                if 'show_unreleased' in self.request.session['filter']:
+                if 'show_unreleased' in filters:
                     queryset = queryset.exclude(status=6)
-                elif 'hide_unreleased' in self.request.session['filter']:
+                elif 'hide_unreleased' in filters:
                     queryset = queryset.filter(status=6)
 
             # Filter genres
-            if 'genres' in self.request.session and self.request.session['genres']:
-                genre_ids = [GENRE_DICT[genre] for genre in self.request.session['genres']]
-                for genre_id in genre_ids:
-                    queryset = queryset.filter(genres__tmdb_id=genre_id)
-                queryset = queryset.distinct()
+            if genres:
+                required_genre_ids.update(GENRE_DICT[genre] for genre in genres)
+
+            # Genres are checked on genre_ids array of movie, all required genres with one GIN index lookup
+            if excluded_genre_ids:
+                queryset = queryset.exclude(genre_ids__overlap=excluded_genre_ids)
+            if required_genre_ids:
+                queryset = queryset.filter(genre_ids__contains=sorted(required_genre_ids))
 
             # Sort
-            sort_by_field = self.sort_by[1:] if self.sort_by.startswith('-') else self.sort_by
-            match sort_by_field:
-                case 'tmdb_popularity':
-                    queryset = queryset.order_by(self.sort_by)
-                case 'release_date':
-                    queryset = queryset.exclude(release_date=None).order_by(self.sort_by)
-                case 'budget':
-                    queryset = queryset.exclude(budget=0).order_by(self.sort_by)
-                case 'revenue':
-                    queryset = queryset.exclude(revenue=0).order_by(self.sort_by)
-                case 'runtime':
-                    queryset = queryset.exclude(runtime=0).order_by(self.sort_by)
-                case 'shuffle':
-                    queryset = queryset.order_by('?')
-                case _:
-                    queryset = queryset.order_by('-tmdb_popularity')
+            sort_by_field = self.sort_by.removeprefix('-')
+            if sort_by_field == 'shuffle':
+                queryset = queryset.order_by('-tmdb_popularity')
+                self.shuffle = True
+            else:
+                if exclude := self.SORT_EXCLUDES[sort_by_field]:
+                    queryset = queryset.exclude(**exclude)
+                queryset = queryset.order_by(self.sort_by)
 
-        return queryset
+        # Only fields shown in movie grid
+        return queryset.only(*MOVIE_GRID_FIELDS)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
+        context['list_type'] = 'movies'
+        context['total_results'] = context['paginator'].count
+        context['base_query'] = self.base_query
+
+        # HTMX requests render only content grid, rest of the page isn't needed
+        if not self.request.headers.get('HX-Request'):
+            context.update(self.get_page_context())
+
+        return context
+
+    def get_page_context(self):
+        """Context for page around content grid: title, dropdowns, filters and search form."""
+
+        context = {}
+
         if self.filter_type:
             context['title'] = self.filter_obj.name
         else:
             context['title'] = 'Discover Movies'
 
-        context['list_type'] = 'movies'
-
         context['sort_by'] = self.sort_by
-        context['verbose_sort_by'] = VERBOSE_SORT_BY_MOVIES.get(self.sort_by, 'Popularity ↓')
+        context['verbose_sort_by'] = VERBOSE_SORT_BY_MOVIES[self.sort_by]
         context['sort_by_dict'] = VERBOSE_SORT_BY_MOVIES
 
         context['year'] = self.year
@@ -161,15 +385,15 @@ class MovieListView(ListView):
         # For createing years dropdown
         if self.decade != 'any':
             decade_int = int(self.decade[:-1])
-            context['years_list'] = list(range(decade_int + 9, decade_int - 1, -1))
+            context['years_list'] = range(decade_int + 9, decade_int - 1, -1)
 
         # For createing decade dropdown
-        context['decade_list'] = [f'{decade}s' for decade in range(2020, 1879, -10)]
+        context['decade_list'] = self.DECADE_LIST
 
         context['filter_dict'] = self.FILTER_DICT
         context['filtered'] = self.request.session.get('filter', [])
 
-        context['genres_list'] = list(GENRE_DICT.keys())
+        context['genres_list'] = self.GENRES_LIST
         context['checked_genres'] = self.request.session.get('genres', [])
 
         context['decade_route_name'] = f'movies_decade'
@@ -184,27 +408,12 @@ class MovieListView(ListView):
 
             context['slug'] = self.slug
 
-        context['total_results'] = context['paginator'].count
-
         context['form'] = self.form
 
-        context['base_query'] = self.base_query
-
         return context
 
     def get(self, request, *args, **kwargs):
-        route_name = request.resolver_match.view_name
-
-        if 'country' in route_name:
-            self.filter_type = 'country'
-        elif 'language' in route_name:
-            self.filter_type = 'language'
-        elif 'company' in route_name:
-            self.filter_type = 'company'
-        elif 'genre' in route_name:
-            self.filter_type = 'genre'
-        else:
-            self.filter_type = ''
+        self.filter_type = self.FILTER_TYPE_BY_ROUTE.get(request.resolver_match.view_name, '')
 
         # Clear session
         if request.get_full_path() in ('/', '/movies/'):
@@ -217,7 +426,8 @@ class MovieListView(ListView):
             if 'filter' in request.GET:
                 self.request.session['filter'] = [i for i in request.GET.getlist('filter') if i != '_empty']
             if 'genres' in request.GET:
-                self.request.session['genres'] = [g for g in request.GET.getlist('genres') if g != '_empty']
+                # Only known genres, so they can be mapped to IDs without checking on every request
+                self.request.session['genres'] = [g for g in request.GET.getlist('genres') if g in GENRE_DICT]
 
         # Get base query for pagination
         self.base_query = get_base_query(request)
@@ -225,11 +435,12 @@ class MovieListView(ListView):
         return super().get(request, *args, **kwargs)
 
 
-class PeopleListView(ListView):
+class PeopleListView(TrigramSearchMixin, ShuffleMixin, ListView):
     template_name = 'moviedb/main.html'
     context_object_name = 'people'
     form = SearchForm()
     paginate_by = 24
+    paginator_class = CachedCountPaginator
 
     VERBOSE_SORT_BY = {
         '-tmdb_popularity': 'Popularity ↓',
@@ -259,6 +470,9 @@ class PeopleListView(ListView):
     def get_queryset(self):
         queryset = Person.objects.filter(removed_from_tmdb=False)
 
+        sort_by = self.kwargs.get('sort_by', '-tmdb_popularity')
+        self.sort_by = sort_by if sort_by in self.VERBOSE_SORT_BY else '-tmdb_popularity'
+
         department = self.kwargs.get('department', 'any')
         if department != 'any' and department in self.VERBOSE_DEPARTMENT:
             if department == 'acting':
@@ -274,31 +488,25 @@ class PeopleListView(ListView):
             if self.form.is_valid():
                 query = self.form.cleaned_data['query']
 
-                queryset = queryset.annotate(similarity=TrigramSimilarity('name', query)).filter(similarity__gt=0.3).order_by('-similarity')
+                queryset = self.trigram_search(queryset, ('name',), query, 0.3)
         else:
             queryset = queryset.filter(adult=False)
-            sort_by = self.kwargs.get('sort_by', '-tmdb_popularity')
-            sort_by_field = sort_by[1:] if sort_by.startswith('-') else sort_by
-            match sort_by_field:
-                case 'combined_roles':
-                    queryset = queryset.annotate(combines_roles=F('cast_roles_count') + F('crew_roles_count')).order_by('-combines_roles')
-                case 'shuffle':
-                    queryset = queryset.order_by('?')
-                case _:
-                    if sort_by in self.VERBOSE_SORT_BY:
-                        queryset = queryset.order_by(sort_by)
-                    else:
-                        queryset = queryset.order_by('-tmdb_popularity')
+            if self.sort_by == 'shuffle':
+                queryset = queryset.order_by('-tmdb_popularity')
+                self.shuffle = True
+            else:
+                queryset = queryset.order_by(self.sort_by)
 
-        return queryset
+        # Only fields shown in people grid
+        return queryset.only('slug', 'name', 'profile_path')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['title'] = 'People'
         context['list_type'] = 'people'
 
-        context['sort_by'] = self.kwargs.get('sort_by', '-tmdb_popularity')
-        context['verbose_sort_by'] = self.VERBOSE_SORT_BY.get(context['sort_by'], 'Popularity ↓')
+        context['sort_by'] = self.sort_by
+        context['verbose_sort_by'] = self.VERBOSE_SORT_BY[self.sort_by]
         context['sort_by_dict'] = self.VERBOSE_SORT_BY
 
         context['department'] = self.kwargs.get('department', 'any')
@@ -322,9 +530,19 @@ class PeopleListView(ListView):
 
 class MovieDetailView(DetailView):
     model = Movie
+    queryset = Movie.objects.select_related('original_language', 'collection').prefetch_related(
+        'genres',
+        'origin_country',
+        'production_countries',
+        'spoken_languages',
+        'production_companies',
+    )
     template_name = 'moviedb/movies/movie_detail.html'
     context_object_name = 'movie'
 
+    # Person fields used in credits
+    PERSON_FIELDS = ('person__slug', 'person__name', 'person__profile_path')
+
     def get_object(self, queryset=None):
         slug = self.kwargs['slug']
         cache_key = f'cached_movie:{slug}'
@@ -354,12 +572,16 @@ class MovieDetailView(DetailView):
             context['collection_movies'] = None
             if context['collection'] and not context['collection'].removed_from_tmdb:
                 context['collection_movies'] = (
-                    context['collection'].movies.exclude(Q(removed_from_tmdb=True) | Q(slug=self.object.slug)).order_by('release_date')
+                    context['collection']
+                    .movies.exclude(Q(removed_from_tmdb=True) | Q(slug=self.object.slug))
+                    .only(*MOVIE_GRID_FIELDS)
+                    .order_by('release_date')
                 )
 
-            context['cast'] = self.object.cast.prefetch_related('person').order_by('order')
+            context['cast'] = self.object.cast.select_related('person').only('character', *self.PERSON_FIELDS).order_by('order')
             context['crew'] = [
-                {'id': moview_crew.person.tmdb_id, 'obj': moview_crew} for moview_crew in self.object.crew.prefetch_related('person')
+                {'id': moview_crew.person.tmdb_id, 'obj': moview_crew}
+                for moview_crew in self.object.crew.select_related('person').only('department', 'job', *self.PERSON_FIELDS)
             ]
             context['crew_map'] = get_crew_map(context['crew'])
             context['directors'] = [director for _, director in context['crew_map']['Director']['objs'].items()]
@@ -391,6 +613,9 @@ class PersonDetailView(DetailView):
     template_name = 'moviedb/people/person_detail.html'
     context_object_name = 'person'
 
+    # Movie fields used in movie grid and for sorting
+    MOVIE_FIELDS = tuple(f'movie__{field}' for field in MOVIE_GRID_FIELDS + ('tmdb_popularity', 'budget', 'revenue', 'runtime'))
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['title'] = f'{self.object.name}'
@@ -404,11 +629,15 @@ class PersonDetailView(DetailView):
             context['known_for'] = ''
 
         crew_roles = [
-            {'id': moview_crew.movie.tmdb_id, 'obj': moview_crew} for moview_crew in self.object.crew_roles.prefetch_related('movie')
+            {'id': moview_crew.movie.tmdb_id, 'obj': moview_crew}
+            for moview_crew in self.object.crew_roles.select_related('movie').only('department', 'job', *self.MOVIE_FIELDS)
         ]
         context['roles_map'] = get_crew_map(crew_roles)
         context['roles_map']['Actor'] = {
-            'objs': {movie_cast.movie.tmdb_id: movie_cast for movie_cast in self.object.cast_roles.prefetch_related('movie')},
+            'objs': {
+                movie_cast.movie.tmdb_id: movie_cast
+                for movie_cast in self.object.cast_roles.select_related('movie').only(*self.MOVIE_FIELDS)
+            },
             'department': 'Acting',
         }
         context['roles_map'] = dict(
@@ -549,11 +778,12 @@ class LanguageListView(ListView):
         return super().get(request, *args, **kwargs)
 
 
-class CollectionsListView(ListView):
+class CollectionsListView(TrigramSearchMixin, ListView):
     template_name = 'moviedb/other.html'
     context_object_name = 'collections'
     form = SearchForm()
     paginate_by = 24
+    paginator_class = CachedCountPaginator
 
     def get_queryset(self):
         queryset = Collection.objects.filter(removed_from_tmdb=False)
@@ -565,13 +795,14 @@ class CollectionsListView(ListView):
 
             self.form = SearchForm(self.request.GET)
             if self.form.is_valid() and (query := self.form.cleaned_data['query']):
-                queryset = queryset.annotate(similarity=TrigramSimilarity('name', query)).filter(similarity__gt=0.2).order_by('-similarity')
+                queryset = self.trigram_search(queryset, ('name',), query, 0.2)
             else:
                 queryset = queryset.filter(adult=False, movies_released__gt=1).order_by('-avg_popularity')
         else:
             queryset = queryset.filter(adult=False, movies_released__gt=1).order_by('-avg_popularity')
 
-        return queryset
+        # Only fields shown in collections grid
+        return queryset.only('slug', 'name', 'poster_path')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -611,8 +842,9 @@ class CollectionDetailView(DetailView):
         cached_context = cache.get(cache_key)
         if cached_context is None:
             context['title'] = f'{self.object.name}'
-            context['movies'] = self.object.movies.filter(removed_from_tmdb=False).order_by('release_date')
-            context['total_movies'] = context['movies'].count()
+            # All movies are shown, fetch them once and count them in Python
+            context['movies'] = list(self.object.movies.filter(removed_from_tmdb=False).only(*MOVIE_GRID_FIELDS).order_by('release_date'))
+            context['total_movies'] = len(context['movies'])
 
             cached_context = {
                 'title': context['title'],
@@ -626,11 +858,12 @@ class CollectionDetailView(DetailView):
         return context
 
 
-class CompanyListView(ListView):
+class CompanyListView(TrigramSearchMixin, ShuffleMixin, ListView):
     template_name = 'moviedb/other.html'
     context_object_name = 'companies'
     form = SearchForm()
     paginate_by = 90
+    paginator_class = CachedCountPaginator
 
     VERBOSE_SORT_BY = {
         '-movie_count': 'Number of movies ↓',
@@ -640,7 +873,8 @@ class CompanyListView(ListView):
     def get_queryset(self):
         queryset = ProductionCompany.objects.filter(removed_from_tmdb=False)
 
-        self.sort_by = self.kwargs.get('sort_by', '-movie_count')
+        sort_by = self.kwargs.get('sort_by', '-movie_count')
+        self.sort_by = sort_by if sort_by in self.VERBOSE_SORT_BY else '-movie_count'
 
         # Search
         if 'query' in self.request.GET:
@@ -649,20 +883,20 @@ class CompanyListView(ListView):
 
             self.form = SearchForm(self.request.GET)
             if self.form.is_valid() and (query := self.form.cleaned_data['query']):
-                queryset = queryset.annotate(similarity=TrigramSimilarity('name', query)).filter(similarity__gt=0.3).order_by('-similarity')
+                queryset = self.trigram_search(queryset, ('name',), query, 0.3)
             else:
                 queryset = queryset.filter(adult=False)
         else:
             queryset = queryset.filter(adult=False)
 
-            sort_by_field = self.sort_by[1:] if self.sort_by.startswith('-') else self.sort_by
-            match sort_by_field:
-                case 'movie_count':
-                    queryset = queryset.order_by(self.sort_by)
-                case 'shuffle':
-                    queryset = queryset.order_by('?')
+            if self.sort_by == 'shuffle':
+                queryset = queryset.order_by('-movie_count')
+                self.shuffle = True
+            else:
+                queryset = queryset.order_by(self.sort_by)
 
-        return queryset
+        # Only fields shown in companies list
+        return queryset.only('slug', 'name')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -670,7 +904,7 @@ class CompanyListView(ListView):
         context['list_type'] = 'companies'
 
         context['sort_by'] = self.sort_by
-        context['verbose_sort_by'] = self.VERBOSE_SORT_BY.get(self.sort_by, 'Number of movies ↓')
+        context['verbose_sort_by'] = self.VERBOSE_SORT_BY[self.sort_by]
         context['sort_by_dict'] = self.VERBOSE_SORT_BY
 
         context['form'] = self.form
@@ -201,6 +201,9 @@ CACHES = {
     }
 }
 
+# Movie list filters are kept in session and read on every list request, read sessions from cache
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
 CELERY_BROKER_URL = os.getenv('CELERY_REDIS_LOCATION')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_REDIS_LOCATION')
 